@@ -795,9 +795,13 @@ def get_missing_books_api():
         from app.services.database import get_all_missing_books
 
         limit = request.args.get("limit", type=int)
+        after_discovered_at = request.args.get("after_discovered_at")
+        after_id = request.args.get("after_id", type=int)
         db_path = current_app.config["DB_PATH"]
 
-        missing_books = get_all_missing_books(db_path, limit)
+        missing_books = get_all_missing_books(
+            db_path, limit, after_discovered_at, after_id
+        )
 
         return jsonify(
             {
@@ -4,19 +4,351 @@ Database service for Calibre Library Monitor
 Handles database initialization and basic operations
 """
 
+import functools
+import json
 import os
+import queue
 import sqlite3
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Tables used by the application database
+SCHEMA_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS author_book (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        author TEXT NOT NULL,
+        title TEXT NOT NULL,
+        missing BOOLEAN NOT NULL DEFAULT 0,
+        olid TEXT,
+        olid_last_updated TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS author_olid (
+        author TEXT PRIMARY KEY,
+        olid TEXT NOT NULL,
+        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS author_processing (
+        author TEXT PRIMARY KEY,
+        last_processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        processed_count INTEGER DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS missing_book (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        author TEXT NOT NULL,
+        title TEXT NOT NULL,
+        discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        source TEXT DEFAULT 'openlibrary',
+        ignored INTEGER NOT NULL DEFAULT 0,
+        UNIQUE(author, title)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ignored_books (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        author TEXT NOT NULL,
+        title TEXT NOT NULL,
+        ignored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(author, title)
+    )
+    """,
+]
+
+# Per-author book counts kept in sync with author_book by triggers
+SUMMARY_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS author_summary (
+        author TEXT PRIMARY KEY,
+        total_books INTEGER NOT NULL DEFAULT 0,
+        missing_books INTEGER NOT NULL DEFAULT 0,
+        books_without_olid INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_author_summary_insert
+    AFTER INSERT ON author_book
+    BEGIN
+        INSERT INTO author_summary (author, total_books, missing_books, books_without_olid)
+        VALUES (NEW.author, 1, NEW.missing = 1, NEW.olid IS NULL)
+        ON CONFLICT(author) DO UPDATE SET
+            total_books = total_books + 1,
+            missing_books = missing_books + excluded.missing_books,
+            books_without_olid = books_without_olid + excluded.books_without_olid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_author_summary_delete
+    AFTER DELETE ON author_book
+    BEGIN
+        UPDATE author_summary SET
+            total_books = total_books - 1,
+            missing_books = missing_books - (OLD.missing = 1),
+            books_without_olid = books_without_olid - (OLD.olid IS NULL)
+        WHERE author = OLD.author;
+        DELETE FROM author_summary WHERE author = OLD.author AND total_books <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_author_summary_update
+    AFTER UPDATE OF author, missing, olid ON author_book
+    BEGIN
+        UPDATE author_summary SET
+            total_books = total_books - 1,
+            missing_books = missing_books - (OLD.missing = 1),
+            books_without_olid = books_without_olid - (OLD.olid IS NULL)
+        WHERE author = OLD.author;
+        INSERT INTO author_summary (author, total_books, missing_books, books_without_olid)
+        VALUES (NEW.author, 1, NEW.missing = 1, NEW.olid IS NULL)
+        ON CONFLICT(author) DO UPDATE SET
+            total_books = total_books + 1,
+            missing_books = missing_books + excluded.missing_books,
+            books_without_olid = books_without_olid + excluded.books_without_olid;
+        DELETE FROM author_summary WHERE author = OLD.author AND total_books <= 0;
+    END
+    """,
+]
+
+# Keep missing_book.ignored in sync with ignored_books so reads skip the anti-join
+IGNORED_FLAG_STATEMENTS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ignored_books_insert
+    AFTER INSERT ON ignored_books
+    BEGIN
+        UPDATE missing_book SET ignored = 1
+        WHERE author = NEW.author AND title = NEW.title;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ignored_books_delete
+    AFTER DELETE ON ignored_books
+    BEGIN
+        UPDATE missing_book SET ignored = 0
+        WHERE author = OLD.author AND title = OLD.title;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_missing_book_insert
+    AFTER INSERT ON missing_book
+    WHEN EXISTS (
+        SELECT 1 FROM ignored_books
+        WHERE author = NEW.author AND title = NEW.title
+    )
+    BEGIN
+        UPDATE missing_book SET ignored = 1 WHERE id = NEW.id;
+    END
+    """,
+]
+
+# Indexes backing the per-author, missing-book and processing-time lookups
+INDEX_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_ab_author ON author_book(author)",
+    "CREATE INDEX IF NOT EXISTS idx_ab_author_title ON author_book(author, title)",
+    "CREATE INDEX IF NOT EXISTS idx_ab_author_nocase ON author_book(author COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS idx_ap_last ON author_processing(last_processed_at DESC)",
+    # Partial covering index for missing books, already in (author, title) order;
+    # it supersedes the earlier single-column idx_ab_missing
+    "DROP INDEX IF EXISTS idx_ab_missing",
+    "CREATE INDEX IF NOT EXISTS idx_ab_missing_author_title ON author_book(author, title) WHERE missing = 1",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_ig_author_title ON ignored_books(author, title)",
+    # Partial indexes over visible (non-ignored) missing books; they supersede
+    # idx_mb_author_disc and idx_mb_discovered
+    "DROP INDEX IF EXISTS idx_mb_author_disc",
+    "DROP INDEX IF EXISTS idx_mb_discovered",
+    "CREATE INDEX IF NOT EXISTS idx_mb_visible ON missing_book(discovered_at DESC, id DESC) WHERE ignored = 0",
+    "CREATE INDEX IF NOT EXISTS idx_mb_author_visible ON missing_book(author, discovered_at DESC) WHERE ignored = 0",
+    "CREATE INDEX IF NOT EXISTS idx_summary_total ON author_summary(total_books DESC, author)",
+]
+
+# Number of rows fetched from Calibre per batch when importing
+FETCH_BATCH_SIZE = 5000
+
+# Database paths whose schema has already been set up in this process
+_schema_initialized: Set[str] = set()
+_schema_lock = threading.Lock()
+
+
+def create_indexes(cursor: sqlite3.Cursor) -> None:
+    """Create the indexes used by the read queries if they don't exist yet."""
+    for statement in INDEX_STATEMENTS:
+        cursor.execute(statement)
+
+    # Let SQLite refresh planner statistics for tables that need it
+    cursor.execute("PRAGMA optimize")
+
+
+def create_author_summary(cursor: sqlite3.Cursor) -> None:
+    """Create the author_summary table and triggers, backfilling it if new."""
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='author_summary'"
+    )
+    exists = cursor.fetchone() is not None
+
+    for statement in SUMMARY_STATEMENTS:
+        cursor.execute(statement)
+
+    if not exists:
+        # Older databases may not have the olid column yet
+        cursor.execute("PRAGMA table_info(author_book)")
+        has_olid = "olid" in [column[1] for column in cursor.fetchall()]
+        without_olid = "olid IS NULL" if has_olid else "1"
+
+        cursor.execute(f"""
+            INSERT INTO author_summary (author, total_books, missing_books, books_without_olid)
+            SELECT author, COUNT(*), SUM(missing = 1), SUM({without_olid})
+            FROM author_book
+            GROUP BY author
+        """)
+
+
+def create_ignored_flag(cursor: sqlite3.Cursor) -> None:
+    """Add the missing_book.ignored column if needed and create its triggers."""
+    cursor.execute("PRAGMA table_info(missing_book)")
+    if "ignored" not in [column[1] for column in cursor.fetchall()]:
+        cursor.execute(
+            "ALTER TABLE missing_book ADD COLUMN ignored INTEGER NOT NULL DEFAULT 0"
+        )
+        cursor.execute("""
+            UPDATE missing_book SET ignored = 1
+            WHERE EXISTS (
+                SELECT 1 FROM ignored_books ib
+                WHERE ib.author = missing_book.author AND ib.title = missing_book.title
+            )
+        """)
+
+    for statement in IGNORED_FLAG_STATEMENTS:
+        cursor.execute(statement)
+
+
+def create_tables(cursor: sqlite3.Cursor) -> None:
+    """Create the application tables if they don't exist yet."""
+    for statement in SCHEMA_STATEMENTS:
+        cursor.execute(statement)
+
+
+def create_schema(cursor: sqlite3.Cursor) -> None:
+    """Create all application tables and indexes if they don't exist yet."""
+    create_tables(cursor)
+    create_author_summary(cursor)
+    create_ignored_flag(cursor)
+    create_indexes(cursor)
+
+
+def _ensure_schema(db_path: str) -> None:
+    """Set up the full schema once per process for the given database."""
+    if db_path in _schema_initialized:
+        return
+
+    # Serialize first-time setup so concurrent callers don't race on DDL
+    with _schema_lock:
+        if db_path in _schema_initialized:
+            return
+
+        # The pooled connection is handed straight back for the caller's query
+        with connection_pool.connection(db_path) as conn:
+            # WAL lets concurrent readers proceed without blocking each other
+            conn.execute("PRAGMA journal_mode=WAL")
+            create_schema(conn.cursor())
+            conn.commit()
+
+        _schema_initialized.add(db_path)
+
+
+# Bounds for the home directory walk in _scan_for_calibre_metadata_db
+SCAN_MAX_DEPTH = 5
+SCAN_MAX_CANDIDATES = 200
+SCAN_SKIP_DIRS = frozenset(
+    {".cache", "node_modules", ".git", "venv", ".venv", "snap", "__pycache__"}
+)
+SCAN_SKIP_PATHS = (
+    Path("Library") / "Caches",
+    Path(".local") / "share" / "Trash",
+)
+
+
+def get_cache_dir() -> Path:
+    """Get the per-user cache directory used for discovery results."""
+    return Path.home() / ".cache" / "ghostbooks"
+
+
+def _load_cached_calibre_path() -> Optional[str]:
+    """Return the cached metadata.db path if the file is unchanged since caching."""
+    cache_file = get_cache_dir() / "calibre_path.txt"
+    try:
+        path, size, mtime_ns = cache_file.read_text(encoding="utf-8").splitlines()[:3]
+        stat_result = os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+    if stat_result.st_size == int(size) and stat_result.st_mtime_ns == int(mtime_ns):
+        return path
+    return None
+
+
+def _store_cached_calibre_path(path: str) -> None:
+    """Record a discovered metadata.db path along with its size and mtime."""
+    cache_file = get_cache_dir() / "calibre_path.txt"
+    try:
+        stat_result = os.stat(path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            f"{path}\n{stat_result.st_size}\n{stat_result.st_mtime_ns}\n",
+            encoding="utf-8",
+        )
+    except OSError:
+        # Caching is best effort; discovery still works without it
+        pass
 
 
 def find_calibre_metadata_db() -> Optional[str]:
     """
     Find the Calibre metadata.db file in common locations.
 
+    The result is cached in-process and on disk, so repeated lookups cost a
+    single stat() as long as the discovered file is unchanged.
+
     Returns:
         str: Path to metadata.db if found, None otherwise
     """
+    path = _find_calibre_metadata_db_cached()
+    if path is None or not os.path.isfile(path):
+        # Don't remember misses or paths that have since disappeared
+        _find_calibre_metadata_db_cached.cache_clear()
+        if path is not None:
+            path = _find_calibre_metadata_db_cached()
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def _find_calibre_metadata_db_cached() -> Optional[str]:
+    """Discover metadata.db, consulting the on-disk cache first."""
+    cached_path = _load_cached_calibre_path()
+    if cached_path:
+        return cached_path
+
+    path = _scan_for_calibre_metadata_db()
+    if path:
+        _store_cached_calibre_path(path)
+    return path
+
+
+def _scan_for_calibre_metadata_db() -> Optional[str]:
+    """Scan common locations and the home directory for metadata.db."""
     # Common Calibre library locations
     home = Path.home()
     potential_paths = [
@@ -51,30 +383,70 @@ def find_calibre_metadata_db() -> Optional[str]:
         home / "Library" / "metadata.db",
     ]
 
-    # Also search for any directory containing metadata.db in home directory
-    try:
-        for path in home.rglob("metadata.db"):
-            if path.is_file():
-                # Verify it's actually a Calibre database by checking for expected tables
-                if verify_calibre_database(str(path)):
-                    return str(path)
-    except (PermissionError, OSError):
-        # Skip if we can't access certain directories
-        pass
-
-    # Check the predefined paths
+    # Check the predefined paths first with a single stat() per candidate
     for path in potential_paths:
-        if path.exists() and path.is_file():
-            if verify_calibre_database(str(path)):
-                return str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and verify_calibre_database(str(path)):
+            return str(path)
+
+    # Fall back to a bounded walk of the home directory
+    for path in _walk_for_metadata_db(home):
+        # Verify it's actually a Calibre database by checking for expected tables
+        if verify_calibre_database(path):
+            return path
 
     return None
 
 
+def _walk_for_metadata_db(root: Path) -> Iterator[str]:
+    """
+    Breadth-first search below root for metadata.db files.
+
+    Heavy or irrelevant directories are skipped, the walk stops at
+    SCAN_MAX_DEPTH levels, and at most SCAN_MAX_CANDIDATES hits are yielded.
+    """
+    skip_paths = {str(root / rel) for rel in SCAN_SKIP_PATHS}
+    candidates = 0
+    level = [str(root)]
+
+    for _depth in range(SCAN_MAX_DEPTH + 1):
+        next_level = []
+        for directory in level:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if (
+                                    entry.name not in SCAN_SKIP_DIRS
+                                    and entry.path not in skip_paths
+                                ):
+                                    next_level.append(entry.path)
+                            elif entry.name == "metadata.db" and entry.is_file():
+                                yield entry.path
+                                candidates += 1
+                                if candidates >= SCAN_MAX_CANDIDATES:
+                                    return
+                        except OSError:
+                            continue
+            except OSError:
+                # Skip if we can't access certain directories
+                continue
+        level = next_level
+        if not level:
+            break
+
+
 def verify_calibre_database(db_path: str) -> bool:
     """
     Verify that a database file is a valid Calibre metadata database.
 
+    Results are cached on disk by (path, size, mtime), so unchanged files
+    are not reopened.
+
     Args:
         db_path: Path to the database file
 
@@ -82,24 +454,75 @@ def verify_calibre_database(db_path: str) -> bool:
         bool: True if it's a valid Calibre database, False otherwise
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        stat_result = os.stat(db_path)
+    except OSError:
+        return False
 
-        # Check for essential Calibre tables
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name IN ('books', 'authors', 'books_authors_link')
-        """)
+    key = os.path.abspath(db_path)
+    signature = [stat_result.st_size, stat_result.st_mtime_ns]
 
-        tables = [row[0] for row in cursor.fetchall()]
-        conn.close()
+    entry = _load_verify_cache().get(key)
+    if entry and entry[:2] == signature:
+        return bool(entry[2])
+
+    is_valid = _verify_calibre_tables(db_path)
+    _update_verify_cache(key, signature + [is_valid])
+    return is_valid
 
-        # All three essential tables should be present
-        return len(tables) >= 3
 
-    except (sqlite3.Error, OSError):
+def _load_verify_cache() -> Dict[str, List[Any]]:
+    """Load the on-disk verification cache, returning {} if unavailable."""
+    try:
+        with open(get_cache_dir() / "verify_cache.json", "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _update_verify_cache(key: str, entry: List[Any]) -> None:
+    """Record a verification result, holding a file lock while rewriting."""
+    cache_dir = get_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_dir / "verify_cache.lock", "w") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            cache = _load_verify_cache()
+            cache[key] = entry
+
+            tmp_path = cache_dir / "verify_cache.json.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_dir / "verify_cache.json")
+    except OSError:
+        # Caching is best effort; verification still works without it
+        pass
+
+
+def _verify_calibre_tables(db_path: str) -> bool:
+    """Open the database read-only and check for the essential Calibre tables."""
+    try:
+        # Open read-only so probing never creates or locks the file
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+    except (sqlite3.Error, OSError, ValueError):
         return False
 
+    try:
+        # All three essential Calibre tables should be present
+        cursor = conn.execute("""
+            SELECT COUNT(*) FROM sqlite_master
+            WHERE type='table' AND name IN ('books', 'authors', 'books_authors_link')
+        """)
+        return cursor.fetchone()[0] == 3
+
+    except sqlite3.Error:
+        return False
+    finally:
+        conn.close()
+
 
 def get_metadata_db_info(db_path: str) -> Dict[str, Any]:
     """
@@ -159,12 +582,14 @@ def initialize_database(
         # Get current database stats for comparison
         try:
             stats = get_database_stats(db_path)
-            return {
-                "success": True,
-                "message": f"Database already exists with {stats['total_books']} records from {stats['authors']} authors",
-                "records_imported": stats["total_books"],
-                "authors_count": stats["authors"],
-            }
+            # An empty schema may have been created by a read before import
+            if stats["total_books"] > 0:
+                return {
+                    "success": True,
+                    "message": f"Database already exists with {stats['total_books']} records from {stats['authors']} authors",
+                    "records_imported": stats["total_books"],
+                    "authors_count": stats["authors"],
+                }
         except Exception:
             # If we can't get stats, proceed with re-initialization
             pass
@@ -172,7 +597,15 @@ def initialize_database(
     # Remove existing database if we're re-initializing
     if os.path.exists(db_path) and force_reinit:
         print(f"Removing existing database for re-initialization: {db_path}")
-        os.remove(db_path)
+        connection_pool.close_all(db_path)
+        # WAL mode leaves companion files that a new database at the same
+        # path would otherwise pick up
+        for path in (db_path, db_path + "-wal", db_path + "-shm"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        _schema_initialized.discard(db_path)
 
     # Try to find metadata.db if the provided path doesn't exist
     if not os.path.exists(calibre_db_path):
@@ -192,6 +625,8 @@ def initialize_database(
 
     print("Initializing database from Calibre metadata...")
 
+    conn = None
+    new_conn = None
     try:
         # Connect to the Calibre database
         conn = sqlite3.connect(calibre_db_path)
@@ -207,168 +642,285 @@ def initialize_database(
         """
 
         cursor.execute(query)
-        results = cursor.fetchall()
-
-        # Create a list of (author, title) tuples
-        author_book_list = [(author, title) for title, author in results]
-
-        # Close the connection
-        conn.close()
 
         # Create a new SQLite database and table for author-book list
         new_conn = sqlite3.connect(db_path)
         new_cursor = new_conn.cursor()
+        new_cursor.execute("PRAGMA journal_mode=WAL")
+
+        # One-shot import: skip fsyncs and keep temporary B-trees in memory
+        new_cursor.execute("PRAGMA synchronous=OFF")
+        new_cursor.execute("PRAGMA temp_store=MEMORY")
+
+        # The whole import is one transaction, so a failure part way leaves no
+        # partial library that a later start would mistake for a finished one
+        new_cursor.execute("BEGIN")
+
+        # Create the tables (author_book has 'missing' and 'olid' columns); the
+        # author summary and indexes are built after the load
+        create_tables(new_cursor)
+
+        # Stream data from the Calibre cursor in batches with missing set to 0 (False)
+        cursor.arraysize = FETCH_BATCH_SIZE
+        records_imported = 0
+        while chunk := cursor.fetchmany():
+            new_cursor.executemany(
+                "INSERT INTO author_book (author, title, missing) VALUES (?, ?, ?)",
+                ((author, title, False) for title, author in chunk),
+            )
+            records_imported += len(chunk)
 
-        # Create table with additional 'missing' and 'olid' columns
-        new_cursor.execute("""
-        CREATE TABLE IF NOT EXISTS author_book (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            author TEXT NOT NULL,
-            title TEXT NOT NULL,
-            missing BOOLEAN NOT NULL DEFAULT 0,
-            olid TEXT,
-            olid_last_updated TIMESTAMP
-        )
-        """)
-
-        # Create the OLID caching table (for backward compatibility and detailed tracking)
-        new_cursor.execute("""
-        CREATE TABLE IF NOT EXISTS author_olid (
-            author TEXT PRIMARY KEY,
-            olid TEXT NOT NULL,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-
-        # Create the author processing table
-        new_cursor.execute("""
-        CREATE TABLE IF NOT EXISTS author_processing (
-            author TEXT PRIMARY KEY,
-            last_processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            processed_count INTEGER DEFAULT 0
-        )
-        """)
+        # Build the author summary and indexes in one pass over the loaded data
+        create_author_summary(new_cursor)
+        create_ignored_flag(new_cursor)
+        create_indexes(new_cursor)
 
-        # Create the missing_book table for storing books found via OpenLibrary API
-        new_cursor.execute("""
-        CREATE TABLE IF NOT EXISTS missing_book (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            author TEXT NOT NULL,
-            title TEXT NOT NULL,
-            discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            source TEXT DEFAULT 'openlibrary',
-            UNIQUE(author, title)
-        )
-        """)
+        # Get unique authors count
+        new_cursor.execute("SELECT COUNT(DISTINCT author) FROM author_book")
+        unique_authors = new_cursor.fetchone()[0]
 
-        # Insert data with missing set to 0 (False)
-        new_cursor.executemany(
-            "INSERT INTO author_book (author, title, missing) VALUES (?, ?, ?)",
-            [(author, title, False) for author, title in author_book_list],
-        )
         new_conn.commit()
-        new_conn.close()
+        _schema_initialized.add(db_path)
 
-        print(f"Inserted {len(author_book_list)} records into {db_path}.")
-
-        # Get unique authors count
-        unique_authors = len(set(author for author, title in author_book_list))
+        print(f"Inserted {records_imported} records into {db_path}.")
 
         return {
             "success": True,
-            "message": f"Initialized database with {len(author_book_list)} records from {unique_authors} authors",
-            "records_imported": len(author_book_list),
+            "message": f"Initialized database with {records_imported} records from {unique_authors} authors",
+            "records_imported": records_imported,
             "authors_count": unique_authors,
         }
 
     except Exception as e:
+        if new_conn is not None:
+            new_conn.rollback()
         return {"success": False, "message": f"Error initializing database: {str(e)}"}
 
+    finally:
+        if new_conn is not None:
+            new_conn.close()
+        if conn is not None:
+            conn.close()
+
+
+# Column names for rows returned as dicts, in SELECT order
+_BOOK_COLUMNS = ("author", "title")
+_MISSING_BOOK_COLUMNS = ("id", "author", "title", "discovered_at", "source")
+_AUTHOR_MISSING_BOOK_COLUMNS = ("title", "discovered_at", "source")
+_IGNORED_BOOK_COLUMNS = ("author", "title", "ignored_at")
+
+
+# Page cache per connection in megabytes, overridable from the environment
+SQLITE_CACHE_MB = int(os.environ.get("GHOSTBOOKS_SQLITE_CACHE_MB", "40"))
+
+# Cache, temp storage and mmap settings applied to every connection
+CONNECTION_PRAGMAS = [
+    f"PRAGMA cache_size=-{SQLITE_CACHE_MB * 1024}",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+]
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply the shared performance PRAGMAs to a connection."""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 
 def get_database_connection(db_path: str) -> sqlite3.Connection:
     """Get a database connection."""
-    return sqlite3.connect(db_path)
+    return configure_connection(sqlite3.connect(db_path))
+
+
+def _database_version(db_path: str) -> Tuple[int, ...]:
+    """Get a signature that changes whenever the database or its WAL is written."""
+    signature: List[int] = []
+    for path in (db_path, f"{db_path}-wal"):
+        try:
+            stat_result = os.stat(path)
+            signature += [stat_result.st_mtime_ns, stat_result.st_size]
+        except OSError:
+            signature += [0, 0]
+    return tuple(signature)
+
+
+class ConnectionPool:
+    """
+    Pool of reusable SQLite connections, kept per database path.
+
+    Read-only connections are pooled separately so heavy read queries can run
+    alongside writers under WAL without sharing their connections.
+    """
+
+    # Applied once to every connection the pool opens
+    PRAGMAS = ["PRAGMA synchronous=NORMAL"] + CONNECTION_PRAGMAS
+
+    def __init__(self, max_connections: int = 5, max_readers: int = 4):
+        """Initialize the pool with per-database connection limits."""
+        self.max_connections = max_connections
+        self.max_readers = max_readers
+        self._pools: Dict[Tuple[str, bool], queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def _get_queue(self, db_path: str, readonly: bool = False) -> queue.Queue:
+        """Get the idle-connection queue for a database, creating it lazily."""
+        key = (db_path, readonly)
+        with self._lock:
+            if key not in self._pools:
+                maxsize = self.max_readers if readonly else self.max_connections
+                self._pools[key] = queue.Queue(maxsize=maxsize)
+            return self._pools[key]
+
+    def _connect(self, db_path: str, readonly: bool = False) -> sqlite3.Connection:
+        """Open and configure a new connection for the pool."""
+        # Connections are handed between threads, but only one uses them at a time
+        if readonly:
+            uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA query_only=1")
+        else:
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self, db_path: str, readonly: bool = False) -> sqlite3.Connection:
+        """Check out an idle connection, opening a new one if none is free."""
+        try:
+            return self._get_queue(db_path, readonly).get_nowait()
+        except queue.Empty:
+            return self._connect(db_path, readonly)
+
+    def release(
+        self, db_path: str, conn: sqlite3.Connection, readonly: bool = False
+    ) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            # Never hand out a connection with a pending transaction
+            if conn.in_transaction:
+                conn.rollback()
+            self._get_queue(db_path, readonly).put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+
+    @contextmanager
+    def connection(
+        self, db_path: str, readonly: bool = False
+    ) -> Iterator[sqlite3.Connection]:
+        """Context manager that checks a connection out and returns it."""
+        conn = self.acquire(db_path, readonly)
+        try:
+            yield conn
+        finally:
+            self.release(db_path, conn, readonly)
+
+    def close_all(self, db_path: Optional[str] = None) -> None:
+        """Close idle connections for one database, or for all of them."""
+        with self._lock:
+            keys = [key for key in self._pools if db_path in (None, key[0])]
+            pools = [self._pools.pop(key) for key in keys]
+
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+# Shared pool used by all database service functions
+connection_pool = ConnectionPool()
 
 
 def get_authors(db_path: str) -> List[str]:
     """Get all unique authors from the database."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT author FROM author_book ORDER BY author")
-    authors = [row[0] for row in cursor.fetchall()]
-    conn.close()
-    return authors
+    return list(_get_authors_cached(db_path, _database_version(db_path)))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_authors_cached(db_path: str, version: Tuple[int, ...]) -> Tuple[str, ...]:
+    """Query all unique authors; version only serves as a cache key."""
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT DISTINCT author FROM author_book ORDER BY author")
+        return tuple(row[0] for row in cursor.fetchall())
 
 
 def get_author_books(db_path: str, author_name: str) -> List[Dict[str, Any]]:
     """Get all books for a specific author."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT id, title, missing FROM author_book WHERE author = ? ORDER BY title",
-        (author_name,),
-    )
-    books = [
-        {"id": row[0], "title": row[1], "missing": bool(row[2])}
-        for row in cursor.fetchall()
-    ]
-    conn.close()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id, title, missing FROM author_book WHERE author = ? ORDER BY title",
+            (author_name,),
+        )
+        books = [
+            {"id": book_id, "title": title, "missing": bool(missing)}
+            for book_id, title, missing in cursor
+        ]
     return books
 
 
 def get_missing_books(db_path: str) -> List[Dict[str, str]]:
     """Get all books marked as missing, excluding ignored books."""
-    ensure_ignored_books_table(db_path)
-
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT ab.author, ab.title 
-        FROM author_book ab
-        LEFT JOIN ignored_books ib ON ab.author = ib.author AND ab.title = ib.title
-        WHERE ab.missing = 1 AND ib.id IS NULL
-        ORDER BY ab.author, ab.title
-    """)
-    missing_books = [{"author": row[0], "title": row[1]} for row in cursor.fetchall()]
-    conn.close()
+    _ensure_schema(db_path)
+
+    with connection_pool.connection(db_path, readonly=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT ab.author, ab.title 
+            FROM author_book ab
+            WHERE ab.missing = 1 AND NOT EXISTS (
+                SELECT 1 FROM ignored_books ib
+                WHERE ib.author = ab.author AND ib.title = ab.title
+            )
+            ORDER BY ab.author, ab.title
+        """)
+        missing_books = [dict(zip(_BOOK_COLUMNS, row)) for row in cursor]
     return missing_books
 
 
 def update_missing_books(db_path: str, author: str, missing_titles: List[str]) -> None:
     """Update missing status for books by an author."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
 
-    # First, reset all books by this author to not missing
-    cursor.execute("UPDATE author_book SET missing = 0 WHERE author = ?", (author,))
+        # First, reset all books by this author to not missing
+        cursor.execute("UPDATE author_book SET missing = 0 WHERE author = ?", (author,))
 
-    # Then mark the missing ones
-    for title in missing_titles:
+        # Then mark the missing ones with a single UPDATE driven by a temp table
         cursor.execute(
-            "UPDATE author_book SET missing = 1 WHERE author = ? AND title = ?",
-            (author, title),
+            "CREATE TEMP TABLE IF NOT EXISTS _tmp_missing (title TEXT PRIMARY KEY)"
+        )
+        cursor.execute("DELETE FROM _tmp_missing")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO _tmp_missing (title) VALUES (?)",
+            [(title,) for title in missing_titles],
+        )
+        cursor.execute(
+            """
+            UPDATE author_book SET missing = 1
+            WHERE author = ? AND title IN (SELECT title FROM _tmp_missing)
+        """,
+            (author,),
         )
 
-    conn.commit()
-    conn.close()
+        conn.commit()
 
 
 def get_database_stats(db_path: str) -> Dict[str, int]:
     """Get database statistics."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT COUNT(DISTINCT author) FROM author_book")
-    author_count = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(*) FROM author_book")
-    total_books = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(*) FROM author_book WHERE missing = 1")
-    missing_books = cursor.fetchone()[0]
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    conn.close()
+        # Compute all three counts in a single pass over author_book
+        cursor.execute("""
+            SELECT COUNT(DISTINCT author), COUNT(*), COALESCE(SUM(missing = 1), 0)
+            FROM author_book
+        """)
+        author_count, total_books, missing_books = cursor.fetchone()
 
     return {
         "authors": author_count,
@@ -379,14 +931,13 @@ def get_database_stats(db_path: str) -> Dict[str, int]:
 
 def search_authors(db_path: str, query: str) -> List[str]:
     """Search for authors by name pattern."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT DISTINCT author FROM author_book WHERE author LIKE ? ORDER BY author LIMIT 50",
-        (f"%{query}%",),
-    )
-    authors = [row[0] for row in cursor.fetchall()]
-    conn.close()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT DISTINCT author FROM author_book WHERE author LIKE ? ORDER BY author LIMIT 50",
+            (f"%{query}%",),
+        )
+        authors = [row[0] for row in cursor.fetchall()]
     return authors
 
 
@@ -394,259 +945,258 @@ def search_authors_with_stats(
     db_path: str, query: str, limit: int = 20
 ) -> List[Dict[str, Any]]:
     """Search for authors by name pattern with detailed stats for autocomplete."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    # Search with case-insensitive matching and return stats
-    cursor.execute(
-        """
-        SELECT 
-            ab.author,
-            COUNT(*) as total_books,
-            SUM(CASE WHEN ab.missing = 1 THEN 1 ELSE 0 END) as missing_books,
-            MAX(ap.last_processed_at) as last_processed
-        FROM author_book ab
-        LEFT JOIN author_processing ap ON ab.author = ap.author
-        WHERE LOWER(ab.author) LIKE LOWER(?)
-        GROUP BY ab.author
-        ORDER BY 
-            CASE 
-                WHEN LOWER(ab.author) LIKE LOWER(?) THEN 1  -- Exact match first
-                WHEN LOWER(ab.author) LIKE LOWER(?) THEN 2  -- Starts with query
-                ELSE 3  -- Contains query
-            END,
-            ab.author
-        LIMIT ?
-    """,
-        (
-            f"%{query}%",  # Main search filter
-            query,  # Exact match priority
-            f"{query}%",  # Starts with priority
-            limit,
-        ),
-    )
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    authors = []
-    for row in cursor.fetchall():
-        authors.append(
-            {
-                "id": row[0],  # Use author name as ID for now
-                "name": row[0],
-                "total_books": row[1],
-                "missing_books": row[2] or 0,
-                "last_processed": row[3],
-                "completion_rate": round(((row[1] - (row[2] or 0)) / row[1]) * 100, 1)
-                if row[1] > 0
-                else 0,
-            }
+        # Search with case-insensitive matching and return stats
+        # (LIKE and NOCASE are already case-insensitive, so no LOWER() is needed)
+        cursor.execute(
+            """
+            SELECT 
+                ab.author,
+                COUNT(*) as total_books,
+                SUM(CASE WHEN ab.missing = 1 THEN 1 ELSE 0 END) as missing_books,
+                MAX(ap.last_processed_at) as last_processed
+            FROM author_book ab
+            LEFT JOIN author_processing ap ON ab.author = ap.author
+            WHERE ab.author LIKE ?
+            GROUP BY ab.author
+            ORDER BY 
+                CASE 
+                    WHEN ab.author = ? COLLATE NOCASE THEN 1  -- Exact match first
+                    WHEN ab.author LIKE ? THEN 2  -- Starts with query
+                    ELSE 3  -- Contains query
+                END,
+                ab.author
+            LIMIT ?
+        """,
+            (
+                f"%{query}%",  # Main search filter
+                query,  # Exact match priority
+                f"{query}%",  # Starts with priority
+                limit,
+            ),
         )
 
-    conn.close()
+        authors = []
+        for row in cursor.fetchall():
+            authors.append(
+                {
+                    "id": row[0],  # Use author name as ID for now
+                    "name": row[0],
+                    "total_books": row[1],
+                    "missing_books": row[2] or 0,
+                    "last_processed": row[3],
+                    "completion_rate": round(
+                        ((row[1] - (row[2] or 0)) / row[1]) * 100, 1
+                    )
+                    if row[1] > 0
+                    else 0,
+                }
+            )
+
     return authors
 
 
 def get_popular_authors(db_path: str, limit: int = 10) -> List[Dict[str, Any]]:
     """Get most popular authors (by book count) for search suggestions."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    _ensure_schema(db_path)
 
-    cursor.execute(
-        """
-        SELECT 
-            author,
-            COUNT(*) as total_books,
-            SUM(CASE WHEN missing = 1 THEN 1 ELSE 0 END) as missing_books
-        FROM author_book
-        GROUP BY author
-        ORDER BY total_books DESC, author
-        LIMIT ?
-    """,
-        (limit,),
-    )
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    authors = []
-    for row in cursor.fetchall():
-        authors.append(
-            {
-                "name": row[0],
-                "total_books": row[1],
-                "missing_books": row[2] or 0,
-                "completion_rate": round(((row[1] - (row[2] or 0)) / row[1]) * 100, 1)
-                if row[1] > 0
-                else 0,
-            }
+        cursor.execute(
+            """
+            SELECT author, total_books, missing_books
+            FROM author_summary
+            ORDER BY total_books DESC, author
+            LIMIT ?
+        """,
+            (limit,),
         )
 
-    conn.close()
+        authors = []
+        for row in cursor.fetchall():
+            authors.append(
+                {
+                    "name": row[0],
+                    "total_books": row[1],
+                    "missing_books": row[2] or 0,
+                    "completion_rate": round(
+                        ((row[1] - (row[2] or 0)) / row[1]) * 100, 1
+                    )
+                    if row[1] > 0
+                    else 0,
+                }
+            )
+
     return authors
 
 
 def ensure_author_processing_table(db_path: str) -> None:
     """Ensure the author_processing table exists for tracking processing times."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS author_processing (
-            author TEXT PRIMARY KEY,
-            last_processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            processed_count INTEGER DEFAULT 0
-        )
-    """)
-
-    conn.commit()
-    conn.close()
+    _ensure_schema(db_path)
 
 
 def update_author_processing_time(db_path: str, author: str) -> None:
     """Update the processing timestamp for an author."""
-    ensure_author_processing_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        INSERT OR REPLACE INTO author_processing (author, last_processed_at, processed_count)
-        VALUES (?, CURRENT_TIMESTAMP, 
-                COALESCE((SELECT processed_count FROM author_processing WHERE author = ?), 0) + 1)
-    """,
-        (author, author),
-    )
+        cursor.execute(
+            """
+            INSERT INTO author_processing (author, last_processed_at, processed_count)
+            VALUES (?, CURRENT_TIMESTAMP, 1)
+            ON CONFLICT(author) DO UPDATE SET
+                last_processed_at = CURRENT_TIMESTAMP,
+                processed_count = processed_count + 1
+        """,
+            (author,),
+        )
 
-    conn.commit()
-    conn.close()
+        conn.commit()
 
 
 def get_recently_processed_authors(
     db_path: str, limit: int = 10
 ) -> List[Dict[str, Any]]:
     """Get recently processed authors with their stats."""
-    ensure_author_processing_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    # Get recently processed authors with their book stats
-    cursor.execute(
-        """
-        SELECT 
-            ap.author,
-            ap.last_processed_at,
-            ap.processed_count,
-            COUNT(ab.id) as total_books,
-            SUM(CASE WHEN ab.missing = 1 THEN 1 ELSE 0 END) as missing_books
-        FROM author_processing ap
-        LEFT JOIN author_book ab ON ap.author = ab.author
-        GROUP BY ap.author, ap.last_processed_at, ap.processed_count
-        ORDER BY ap.last_processed_at DESC
-        LIMIT ?
-    """,
-        (limit,),
-    )
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    authors = []
-    for row in cursor.fetchall():
-        authors.append(
-            {
-                "name": row[0],
-                "last_processed_at": row[1],
-                "processed_count": row[2],
-                "total_books": row[3] or 0,
-                "missing_books": row[4] or 0,
-            }
+        # Get recently processed authors with their book stats
+        cursor.execute(
+            """
+            SELECT 
+                ap.author,
+                ap.last_processed_at,
+                ap.processed_count,
+                COUNT(ab.id) as total_books,
+                SUM(CASE WHEN ab.missing = 1 THEN 1 ELSE 0 END) as missing_books
+            FROM author_processing ap
+            LEFT JOIN author_book ab ON ap.author = ab.author
+            GROUP BY ap.author, ap.last_processed_at, ap.processed_count
+            ORDER BY ap.last_processed_at DESC
+            LIMIT ?
+        """,
+            (limit,),
         )
 
-    conn.close()
+        authors = []
+        for row in cursor.fetchall():
+            authors.append(
+                {
+                    "name": row[0],
+                    "last_processed_at": row[1],
+                    "processed_count": row[2],
+                    "total_books": row[3] or 0,
+                    "missing_books": row[4] or 0,
+                }
+            )
+
     return authors
 
 
+def get_dashboard(db_path: str, limit: int = 10) -> Dict[str, Any]:
+    """
+    Get the dashboard data (stats, popular and recently processed authors).
+
+    The three read-only queries are independent, so they run concurrently on
+    their own connections; with WAL enabled readers don't block each other.
+
+    Args:
+        db_path: Path to the database
+        limit: Maximum number of authors in each author list
+
+    Returns:
+        Dictionary with stats, popular_authors and recent_authors
+    """
+    _ensure_schema(db_path)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        stats = executor.submit(get_database_stats, db_path)
+        popular = executor.submit(get_popular_authors, db_path, limit)
+        recent = executor.submit(get_recently_processed_authors, db_path, limit)
+
+        return {
+            "stats": stats.result(),
+            "popular_authors": popular.result(),
+            "recent_authors": recent.result(),
+        }
+
+
 def ensure_author_olid_table(db_path: str) -> None:
     """Ensure the author_olid table exists for caching OpenLibrary IDs."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS author_olid (
-            author TEXT PRIMARY KEY,
-            olid TEXT NOT NULL,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    conn.commit()
-    conn.close()
+    _ensure_schema(db_path)
 
 
 def get_author_olid(db_path: str, author: str) -> Optional[str]:
     """Get cached OLID for an author."""
-    ensure_author_olid_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute("SELECT olid FROM author_olid WHERE author = ?", (author,))
+        cursor.execute("SELECT olid FROM author_olid WHERE author = ?", (author,))
 
-    result = cursor.fetchone()
-    conn.close()
+        result = cursor.fetchone()
 
     return result[0] if result else None
 
 
 def store_author_olid(db_path: str, author: str, olid: str) -> None:
     """Store or update OLID for an author."""
-    ensure_author_olid_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        INSERT OR REPLACE INTO author_olid (author, olid, last_updated)
-        VALUES (?, ?, CURRENT_TIMESTAMP)
-    """,
-        (author, olid),
-    )
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO author_olid (author, olid, last_updated)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        """,
+            (author, olid),
+        )
 
-    conn.commit()
-    conn.close()
+        conn.commit()
 
 
 def migrate_database_schema(db_path: str) -> Dict[str, Any]:
     """Migrate database schema to add OLID columns if they don't exist."""
     try:
-        conn = get_database_connection(db_path)
-        cursor = conn.cursor()
+        with connection_pool.connection(db_path) as conn:
+            cursor = conn.cursor()
 
-        # Check if OLID columns exist in author_book table
-        cursor.execute("PRAGMA table_info(author_book)")
-        columns = [column[1] for column in cursor.fetchall()]
+            # Check if OLID columns exist in author_book table
+            cursor.execute("PRAGMA table_info(author_book)")
+            columns = [column[1] for column in cursor.fetchall()]
 
-        migrations_applied = []
+            migrations_applied = []
 
-        # Add OLID column if it doesn't exist
-        if "olid" not in columns:
-            cursor.execute("ALTER TABLE author_book ADD COLUMN olid TEXT")
-            migrations_applied.append("Added 'olid' column to author_book table")
+            # Add OLID column if it doesn't exist
+            if "olid" not in columns:
+                cursor.execute("ALTER TABLE author_book ADD COLUMN olid TEXT")
+                migrations_applied.append("Added 'olid' column to author_book table")
 
-        # Add OLID last updated column if it doesn't exist
-        if "olid_last_updated" not in columns:
-            cursor.execute(
-                "ALTER TABLE author_book ADD COLUMN olid_last_updated TIMESTAMP"
-            )
-            migrations_applied.append(
-                "Added 'olid_last_updated' column to author_book table"
-            )
-
-        # Ensure the author_olid table exists (for detailed tracking)
-        ensure_author_olid_table(db_path)
+            # Add OLID last updated column if it doesn't exist
+            if "olid_last_updated" not in columns:
+                cursor.execute(
+                    "ALTER TABLE author_book ADD COLUMN olid_last_updated TIMESTAMP"
+                )
+                migrations_applied.append(
+                    "Added 'olid_last_updated' column to author_book table"
+                )
 
-        # Ensure the missing_book table exists
-        ensure_missing_book_table(db_path)
+            # Ensure all supporting tables and lookup indexes exist
+            create_schema(cursor)
 
-        conn.commit()
-        conn.close()
+            conn.commit()
+        _schema_initialized.add(db_path)
 
         return {
             "success": True,
@@ -660,157 +1210,163 @@ def migrate_database_schema(db_path: str) -> Dict[str, Any]:
 
 def store_author_olid_permanent(db_path: str, author: str, olid: Optional[str]) -> None:
     """Store OLID permanently in both the main author_book table and the tracking table."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    store_author_olids_bulk(db_path, {author: olid})
 
-    try:
-        # Update all records for this author in the main author_book table
-        cursor.execute(
-            """
-            UPDATE author_book 
-            SET olid = ?, olid_last_updated = CURRENT_TIMESTAMP 
-            WHERE author = ?
-        """,
-            (olid, author),
-        )
 
-        # Also store in the tracking table for detailed statistics
-        if olid:
-            cursor.execute(
+def store_author_olids_bulk(db_path: str, olids: Dict[str, Optional[str]]) -> None:
+    """
+    Store OLIDs for many authors in a single transaction.
+
+    Args:
+        db_path: Path to the database
+        olids: Mapping of author name to OLID (None if no OLID was found)
+    """
+    if not olids:
+        return
+
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+
+        try:
+            # Update all records for these authors in the main author_book table
+            cursor.executemany(
+                """
+                UPDATE author_book 
+                SET olid = ?, olid_last_updated = CURRENT_TIMESTAMP 
+                WHERE author = ?
+            """,
+                [(olid, author) for author, olid in olids.items()],
+            )
+
+            # Also store found OLIDs in the tracking table for detailed statistics
+            cursor.executemany(
                 """
                 INSERT OR REPLACE INTO author_olid (author, olid, last_updated)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
             """,
-                (author, olid),
+                [(author, olid) for author, olid in olids.items() if olid],
             )
 
-        conn.commit()
+            conn.commit()
 
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
+        except Exception as e:
+            conn.rollback()
+            raise e
 
 
 def get_author_olid_from_books(db_path: str, author: str) -> Optional[str]:
     """Get OLID for an author from the main author_book table."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute(
-        "SELECT olid FROM author_book WHERE author = ? AND olid IS NOT NULL LIMIT 1",
-        (author,),
-    )
+        cursor.execute(
+            "SELECT olid FROM author_book WHERE author = ? AND olid IS NOT NULL LIMIT 1",
+            (author,),
+        )
 
-    result = cursor.fetchone()
-    conn.close()
+        result = cursor.fetchone()
 
     return result[0] if result else None
 
 
 def get_authors_with_olid(db_path: str) -> List[Dict[str, Any]]:
     """Get all authors that have OLID stored."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT DISTINCT author, olid, olid_last_updated,
-               COUNT(*) as book_count
-        FROM author_book 
-        WHERE olid IS NOT NULL 
-        GROUP BY author, olid, olid_last_updated
-        ORDER BY olid_last_updated DESC
-    """)
-
-    authors = []
-    for row in cursor.fetchall():
-        authors.append(
-            {
-                "author": row[0],
-                "olid": row[1],
-                "last_updated": row[2],
-                "book_count": row[3],
-            }
-        )
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT DISTINCT author, olid, olid_last_updated,
+                   COUNT(*) as book_count
+            FROM author_book 
+            WHERE olid IS NOT NULL 
+            GROUP BY author, olid, olid_last_updated
+            ORDER BY olid_last_updated DESC
+        """)
+
+        authors = []
+        for row in cursor.fetchall():
+            authors.append(
+                {
+                    "author": row[0],
+                    "olid": row[1],
+                    "last_updated": row[2],
+                    "book_count": row[3],
+                }
+            )
 
-    conn.close()
     return authors
 
 
 def get_authors_without_olid(db_path: str) -> List[Dict[str, Any]]:
     """Get all authors that don't have OLID stored."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT DISTINCT author, COUNT(*) as book_count
-        FROM author_book 
-        WHERE olid IS NULL 
-        GROUP BY author
-        ORDER BY book_count DESC
-    """)
-
-    authors = []
-    for row in cursor.fetchall():
-        authors.append({"author": row[0], "book_count": row[1]})
-
-    conn.close()
+    _ensure_schema(db_path)
+
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT author, books_without_olid as book_count
+            FROM author_summary
+            WHERE books_without_olid > 0
+            ORDER BY book_count DESC
+        """)
+
+        authors = []
+        for row in cursor.fetchall():
+            authors.append({"author": row[0], "book_count": row[1]})
+
     return authors
 
 
 def clear_author_olid_cache(db_path: str) -> int:
     """Clear all cached OLIDs and return count of cleared entries."""
-    ensure_author_olid_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT COUNT(*) FROM author_olid")
-    count = cursor.fetchone()[0]
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute("DELETE FROM author_olid")
-    conn.commit()
-    conn.close()
+        cursor.execute("DELETE FROM author_olid")
+        count = cursor.rowcount
+        conn.commit()
 
     return count
 
 
 def get_author_olid_stats(db_path: str) -> Dict[str, Any]:
     """Get statistics about OLID storage and cache performance."""
-    ensure_author_olid_table(db_path)
-
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    _ensure_schema(db_path)
 
-    # Get total entries in tracking table
-    cursor.execute("SELECT COUNT(*) FROM author_olid")
-    total_entries = cursor.fetchone()[0]
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    # Get entries with valid OLIDs (not null/empty)
-    cursor.execute(
-        "SELECT COUNT(*) FROM author_olid WHERE olid IS NOT NULL AND olid != ''"
-    )
-    entries_with_olid = cursor.fetchone()[0]
+        # Get total entries in tracking table
+        cursor.execute("SELECT COUNT(*) FROM author_olid")
+        total_entries = cursor.fetchone()[0]
 
-    # Get entries without valid OLIDs
-    entries_without_olid = total_entries - entries_with_olid
+        # Get entries with valid OLIDs (not null/empty)
+        cursor.execute(
+            "SELECT COUNT(*) FROM author_olid WHERE olid IS NOT NULL AND olid != ''"
+        )
+        entries_with_olid = cursor.fetchone()[0]
 
-    # Calculate cache hit rate
-    cache_hit_rate = round(
-        (entries_with_olid / total_entries * 100) if total_entries > 0 else 0, 1
-    )
+        # Get entries without valid OLIDs
+        entries_without_olid = total_entries - entries_with_olid
 
-    # Get additional stats from main author_book table
-    cursor.execute(
-        "SELECT COUNT(DISTINCT author) FROM author_book WHERE olid IS NOT NULL"
-    )
-    authors_with_permanent_olid = cursor.fetchone()[0]
+        # Calculate cache hit rate
+        cache_hit_rate = round(
+            (entries_with_olid / total_entries * 100) if total_entries > 0 else 0, 1
+        )
 
-    cursor.execute("SELECT COUNT(DISTINCT author) FROM author_book WHERE olid IS NULL")
-    authors_without_permanent_olid = cursor.fetchone()[0]
+        # Get additional stats from main author_book table
+        cursor.execute(
+            "SELECT COUNT(DISTINCT author) FROM author_book WHERE olid IS NOT NULL"
+        )
+        authors_with_permanent_olid = cursor.fetchone()[0]
 
-    conn.close()
+        cursor.execute(
+            "SELECT COUNT(DISTINCT author) FROM author_book WHERE olid IS NULL"
+        )
+        authors_without_permanent_olid = cursor.fetchone()[0]
 
     return {
         "total_entries": total_entries,
@@ -860,29 +1416,37 @@ def sync_with_calibre_metadata(db_path: str, calibre_db_path: str) -> Dict[str,
             ORDER BY a.name, b.title
         """)
 
-        new_records = 0
         updated_records = 0
 
-        for row in calibre_cursor.fetchall():
-            author = row["author"].strip()
-            title = row["title"].strip()
+        new_records = 0
+        calibre_cursor.arraysize = FETCH_BATCH_SIZE
 
-            # Skip empty authors or titles
-            if not author or not title:
-                continue
+        while chunk := calibre_cursor.fetchmany():
+            # Collect combinations not yet in the application database
+            new_rows = []
+            for row in chunk:
+                author = row["author"].strip()
+                title = row["title"].strip()
 
-            combination = (author, title)
+                # Skip empty authors or titles
+                if not author or not title:
+                    continue
 
-            if combination not in existing_combinations:
-                # New record - insert it
-                app_cursor.execute(
-                    """
-                    INSERT INTO author_book (author, title, missing)
-                    VALUES (?, ?, 0)
-                """,
-                    (author, title),
-                )
-                new_records += 1
+                combination = (author, title)
+
+                if combination not in existing_combinations:
+                    existing_combinations.add(combination)
+                    new_rows.append(combination)
+
+            # Insert the new records from this batch at once
+            app_cursor.executemany(
+                """
+                INSERT INTO author_book (author, title, missing)
+                VALUES (?, ?, 0)
+            """,
+                new_rows,
+            )
+            new_records += len(new_rows)
 
         # Get final statistics
         app_cursor.execute("SELECT COUNT(DISTINCT author) FROM author_book")
@@ -913,22 +1477,7 @@ def sync_with_calibre_metadata(db_path: str, calibre_db_path: str) -> Dict[str,
 
 def ensure_missing_book_table(db_path: str) -> None:
     """Ensure the missing_book table exists for storing missing books found via OpenLibrary API."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS missing_book (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            author TEXT NOT NULL,
-            title TEXT NOT NULL,
-            discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            source TEXT DEFAULT 'openlibrary',
-            UNIQUE(author, title)
-        )
-    """)
-
-    conn.commit()
-    conn.close()
+    _ensure_schema(db_path)
 
 
 def store_missing_books(db_path: str, author: str, missing_books: List[str]) -> int:
@@ -946,34 +1495,32 @@ def store_missing_books(db_path: str, author: str, missing_books: List[str]) ->
     if not missing_books:
         return 0
 
-    ensure_missing_book_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    new_books_added = 0
+        new_books_added = 0
 
-    try:
-        for title in missing_books:
-            # Use INSERT OR IGNORE to avoid duplicates
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO missing_book (author, title, source) 
-                VALUES (?, ?, 'openlibrary')
-                """,
-                (author, title),
-            )
-            # Check if a row was actually inserted
-            if cursor.rowcount > 0:
-                new_books_added += 1
+        try:
+            for title in missing_books:
+                # Use INSERT OR IGNORE to avoid duplicates
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO missing_book (author, title, source) 
+                    VALUES (?, ?, 'openlibrary')
+                    """,
+                    (author, title),
+                )
+                # Check if a row was actually inserted
+                if cursor.rowcount > 0:
+                    new_books_added += 1
 
-        conn.commit()
+            conn.commit()
 
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
+        except Exception as e:
+            conn.rollback()
+            raise e
 
     return new_books_added
 
@@ -982,6 +1529,8 @@ def get_missing_books_by_author(db_path: str, author: str) -> List[Dict[str, Any
     """
     Get all missing books for a specific author, excluding ignored books.
 
+    Results are cached until the database (or its WAL) changes on disk.
+
     Args:
         db_path: Path to the database
         author: Author name
@@ -989,70 +1538,83 @@ def get_missing_books_by_author(db_path: str, author: str) -> List[Dict[str, Any
     Returns:
         List of missing books with metadata
     """
-    ensure_missing_book_table(db_path)
-    ensure_ignored_books_table(db_path)
-
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    _ensure_schema(db_path)
 
-    cursor.execute(
-        """
-        SELECT mb.title, mb.discovered_at, mb.source 
-        FROM missing_book mb
-        LEFT JOIN ignored_books ib ON mb.author = ib.author AND mb.title = ib.title
-        WHERE mb.author = ? AND ib.id IS NULL
-        ORDER BY mb.discovered_at DESC
-        """,
-        (author,),
+    rows = _get_missing_books_by_author_cached(
+        db_path, author, _database_version(db_path)
     )
+    return [dict(zip(_AUTHOR_MISSING_BOOK_COLUMNS, row)) for row in rows]
 
-    books = [
-        {"title": row[0], "discovered_at": row[1], "source": row[2]}
-        for row in cursor.fetchall()
-    ]
 
-    conn.close()
-    return books
+@functools.lru_cache(maxsize=512)
+def _get_missing_books_by_author_cached(
+    db_path: str, author: str, version: Tuple[int, ...]
+) -> Tuple[Tuple[Any, ...], ...]:
+    """Query an author's missing books; version only serves as a cache key."""
+    with connection_pool.connection(db_path, readonly=True) as conn:
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT mb.title, mb.discovered_at, mb.source 
+            FROM missing_book mb
+            WHERE mb.author = ? AND mb.ignored = 0
+            ORDER BY mb.discovered_at DESC
+            """,
+            (author,),
+        )
+
+        return tuple(cursor.fetchall())
 
 
 def get_all_missing_books(
-    db_path: str, limit: Optional[int] = None
+    db_path: str,
+    limit: Optional[int] = None,
+    after_discovered_at: Optional[str] = None,
+    after_rowid: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Get all missing books from the database, excluding ignored books.
 
+    Results are ordered newest first. To fetch the next page, pass the
+    discovered_at and id of the last book from the previous page.
+
     Args:
         db_path: Path to the database
         limit: Optional limit on number of results
+        after_discovered_at: discovered_at of the last book already seen
+        after_rowid: id of the last book already seen
 
     Returns:
         List of missing books with metadata
     """
-    ensure_missing_book_table(db_path)
-    ensure_ignored_books_table(db_path)
-
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    query = """
-        SELECT mb.author, mb.title, mb.discovered_at, mb.source 
-        FROM missing_book mb
-        LEFT JOIN ignored_books ib ON mb.author = ib.author AND mb.title = ib.title
-        WHERE ib.id IS NULL
-        ORDER BY mb.discovered_at DESC
-    """
+    _ensure_schema(db_path)
 
-    if limit:
-        query += f" LIMIT {limit}"
+    with connection_pool.connection(db_path, readonly=True) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute(query)
+        query = """
+            SELECT mb.id, mb.author, mb.title, mb.discovered_at, mb.source 
+            FROM missing_book mb
+            WHERE mb.ignored = 0
+        """
+        params: List[Any] = []
 
-    books = [
-        {"author": row[0], "title": row[1], "discovered_at": row[2], "source": row[3]}
-        for row in cursor.fetchall()
-    ]
+        if after_discovered_at is not None and after_rowid is not None:
+            # Keyset seek instead of OFFSET so deep pages stay cheap
+            query += " AND (mb.discovered_at, mb.id) < (?, ?)"
+            params.extend([after_discovered_at, int(after_rowid)])
+
+        query += " ORDER BY mb.discovered_at DESC, mb.id DESC"
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        cursor.execute(query, params)
+
+        books = [dict(zip(_MISSING_BOOK_COLUMNS, row)) for row in cursor]
 
-    conn.close()
     return books
 
 
@@ -1066,51 +1628,46 @@ def get_missing_book_stats(db_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary with missing book statistics
     """
-    ensure_missing_book_table(db_path)
-    ensure_ignored_books_table(db_path)
-
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    # Total missing books (excluding ignored)
-    cursor.execute("""
-        SELECT COUNT(*) FROM missing_book mb
-        LEFT JOIN ignored_books ib ON mb.author = ib.author AND mb.title = ib.title
-        WHERE ib.id IS NULL
-    """)
-    total_missing = cursor.fetchone()[0]
-
-    # Authors with missing books (excluding ignored)
-    cursor.execute("""
-        SELECT COUNT(DISTINCT mb.author) FROM missing_book mb
-        LEFT JOIN ignored_books ib ON mb.author = ib.author AND mb.title = ib.title
-        WHERE ib.id IS NULL
-    """)
-    authors_with_missing = cursor.fetchone()[0]
-
-    # Recent discoveries (last 7 days, excluding ignored)
-    cursor.execute("""
-        SELECT COUNT(*) FROM missing_book mb
-        LEFT JOIN ignored_books ib ON mb.author = ib.author AND mb.title = ib.title
-        WHERE mb.discovered_at >= datetime('now', '-7 days') AND ib.id IS NULL
-    """)
-    recent_discoveries = cursor.fetchone()[0]
-
-    # Top authors with most missing books (excluding ignored)
-    cursor.execute("""
-        SELECT mb.author, COUNT(*) as missing_count 
-        FROM missing_book mb
-        LEFT JOIN ignored_books ib ON mb.author = ib.author AND mb.title = ib.title
-        WHERE ib.id IS NULL
-        GROUP BY mb.author 
-        ORDER BY missing_count DESC 
-        LIMIT 10
-    """)
-    top_authors = [
-        {"author": row[0], "missing_count": row[1]} for row in cursor.fetchall()
-    ]
+    _ensure_schema(db_path)
+
+    with connection_pool.connection(db_path, readonly=True) as conn:
+        cursor = conn.cursor()
+
+        # Derive all statistics from one pass over the non-ignored missing books;
+        # each row is tagged with the statistic it belongs to
+        cursor.execute("""
+            WITH mb_filtered AS (
+                SELECT mb.author, mb.discovered_at
+                FROM missing_book mb
+                WHERE mb.ignored = 0
+            )
+            SELECT 'total', NULL, COUNT(*) FROM mb_filtered
+            UNION ALL
+            SELECT 'authors', NULL, COUNT(DISTINCT author) FROM mb_filtered
+            UNION ALL
+            SELECT 'recent', NULL, COUNT(*) FROM mb_filtered
+            WHERE discovered_at >= datetime('now', '-7 days')
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'top', author, COUNT(*) as missing_count
+                FROM mb_filtered
+                GROUP BY author
+                ORDER BY missing_count DESC
+                LIMIT 10
+            )
+        """)
+
+        counts = {}
+        top_authors = []
+        for kind, author, value in cursor.fetchall():
+            if kind == "top":
+                top_authors.append({"author": author, "missing_count": value})
+            else:
+                counts[kind] = value
 
-    conn.close()
+    total_missing = counts["total"]
+    authors_with_missing = counts["authors"]
+    recent_discoveries = counts["recent"]
 
     return {
         "total_missing": total_missing,
@@ -1131,40 +1688,30 @@ def clear_missing_books(db_path: str, author: Optional[str] = None) -> int:
     Returns:
         Number of records deleted
     """
-    ensure_missing_book_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    if author:
-        cursor.execute("DELETE FROM missing_book WHERE author = ?", (author,))
-    else:
-        cursor.execute("DELETE FROM missing_book")
+        if author:
+            cursor.execute("DELETE FROM missing_book WHERE author = ?", (author,))
+            deleted_count = cursor.rowcount
+        else:
+            # Count up front so the unqualified DELETE can use SQLite's
+            # truncate optimization instead of removing rows one at a time
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT COUNT(*) FROM missing_book")
+            deleted_count = cursor.fetchone()[0]
+            cursor.execute("DELETE FROM missing_book")
 
-    deleted_count = cursor.rowcount
-    conn.commit()
-    conn.close()
+        conn.commit()
 
     return deleted_count
 
 
 def ensure_ignored_books_table(db_path: str) -> None:
     """Ensure the ignored_books table exists for storing ignored missing books."""
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS ignored_books (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            author TEXT NOT NULL,
-            title TEXT NOT NULL,
-            ignored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(author, title)
-        )
-    """)
-
-    conn.commit()
-    conn.close()
+    _ensure_schema(db_path)
 
 
 def ignore_book(db_path: str, author: str, title: str) -> bool:
@@ -1179,38 +1726,61 @@ def ignore_book(db_path: str, author: str, title: str) -> bool:
     Returns:
         bool: True if successfully ignored, False otherwise
     """
-    ensure_ignored_books_table(db_path)
-    ensure_missing_book_table(db_path)
+    return ignore_books(db_path, [(author, title)])
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
 
-    try:
-        # Add to ignored_books table (using INSERT OR IGNORE to handle duplicates)
-        cursor.execute(
-            "INSERT OR IGNORE INTO ignored_books (author, title) VALUES (?, ?)",
-            (author, title),
-        )
+def ignore_books(db_path: str, books: Iterable[Tuple[str, str]]) -> bool:
+    """
+    Add several books to the ignored list in a single transaction.
 
-        # Remove from missing_book table if it exists there
-        cursor.execute(
-            "DELETE FROM missing_book WHERE author = ? AND title = ?", (author, title)
-        )
+    Args:
+        db_path: Path to the database
+        books: (author, title) pairs to ignore
 
-        # Update author_book table to set missing = 0 if it exists there
-        cursor.execute(
-            "UPDATE author_book SET missing = 0 WHERE author = ? AND title = ?",
-            (author, title),
-        )
+    Returns:
+        bool: True if successfully ignored, False otherwise
+    """
+    _ensure_schema(db_path)
 
-        conn.commit()
-        return True
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    except Exception:
-        conn.rollback()
-        return False
-    finally:
-        conn.close()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _tmp_books (author TEXT, title TEXT)"
+            )
+            cursor.execute("DELETE FROM _tmp_books")
+            cursor.executemany(
+                "INSERT INTO _tmp_books (author, title) VALUES (?, ?)", books
+            )
+
+            # Add to ignored_books table (using INSERT OR IGNORE to handle duplicates)
+            cursor.execute("""
+                INSERT OR IGNORE INTO ignored_books (author, title)
+                SELECT author, title FROM _tmp_books
+            """)
+
+            # Remove from missing_book table if they exist there
+            cursor.execute("""
+                DELETE FROM missing_book
+                WHERE (author, title) IN (SELECT author, title FROM _tmp_books)
+            """)
+
+            # Update author_book table to set missing = 0 if they exist there
+            cursor.execute("""
+                UPDATE author_book SET missing = 0
+                WHERE (author, title) IN (SELECT author, title FROM _tmp_books)
+            """)
+
+            cursor.execute("DELETE FROM _tmp_books")
+            conn.commit()
+            return True
+
+        except Exception:
+            conn.rollback()
+            return False
 
 
 def unignore_book(db_path: str, author: str, title: str) -> bool:
@@ -1225,24 +1795,23 @@ def unignore_book(db_path: str, author: str, title: str) -> bool:
     Returns:
         bool: True if successfully unignored, False otherwise
     """
-    ensure_ignored_books_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    try:
-        cursor.execute(
-            "DELETE FROM ignored_books WHERE author = ? AND title = ?", (author, title)
-        )
+        try:
+            cursor.execute(
+                "DELETE FROM ignored_books WHERE author = ? AND title = ?",
+                (author, title),
+            )
 
-        conn.commit()
-        return cursor.rowcount > 0
+            conn.commit()
+            return cursor.rowcount > 0
 
-    except Exception:
-        conn.rollback()
-        return False
-    finally:
-        conn.close()
+        except Exception:
+            conn.rollback()
+            return False
 
 
 def is_book_ignored(db_path: str, author: str, title: str) -> bool:
@@ -1257,21 +1826,59 @@ def is_book_ignored(db_path: str, author: str, title: str) -> bool:
     Returns:
         bool: True if book is ignored, False otherwise
     """
-    ensure_ignored_books_table(db_path)
-
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    _ensure_schema(db_path)
 
-    cursor.execute(
-        "SELECT 1 FROM ignored_books WHERE author = ? AND title = ? LIMIT 1",
-        (author, title),
-    )
+    with connection_pool.connection(db_path) as conn:
+        # Pooled connections keep sqlite3's per-connection statement cache warm,
+        # so this fixed SQL string is only prepared once per connection
+        cursor = conn.execute(
+            "SELECT EXISTS(SELECT 1 FROM ignored_books WHERE author = ? AND title = ?)",
+            (author, title),
+        )
 
-    result = cursor.fetchone() is not None
-    conn.close()
+        result = bool(cursor.fetchone()[0])
     return result
 
 
+def are_books_ignored(
+    db_path: str, books: Iterable[Tuple[str, str]]
+) -> Set[Tuple[str, str]]:
+    """
+    Check many books against the ignored list in one round trip.
+
+    Args:
+        db_path: Path to the database
+        books: (author, title) pairs to check
+
+    Returns:
+        Set of the (author, title) pairs that are ignored
+    """
+    _ensure_schema(db_path)
+
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _tmp_books (author TEXT, title TEXT)"
+        )
+        cursor.execute("DELETE FROM _tmp_books")
+        cursor.executemany(
+            "INSERT INTO _tmp_books (author, title) VALUES (?, ?)", books
+        )
+
+        cursor.execute("""
+            SELECT DISTINCT tb.author, tb.title
+            FROM _tmp_books tb
+            JOIN ignored_books ib ON ib.author = tb.author AND ib.title = tb.title
+        """)
+        ignored = {(row[0], row[1]) for row in cursor.fetchall()}
+
+        cursor.execute("DELETE FROM _tmp_books")
+        conn.commit()
+
+    return ignored
+
+
 def get_ignored_books(
     db_path: str, author: Optional[str] = None
 ) -> List[Dict[str, Any]]:
@@ -1285,27 +1892,23 @@ def get_ignored_books(
     Returns:
         List of ignored books with metadata
     """
-    ensure_ignored_books_table(db_path)
+    _ensure_schema(db_path)
 
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    with connection_pool.connection(db_path, readonly=True) as conn:
+        cursor = conn.cursor()
 
-    if author:
-        cursor.execute(
-            "SELECT author, title, ignored_at FROM ignored_books WHERE author = ? ORDER BY ignored_at DESC",
-            (author,),
-        )
-    else:
-        cursor.execute(
-            "SELECT author, title, ignored_at FROM ignored_books ORDER BY ignored_at DESC"
-        )
+        if author:
+            cursor.execute(
+                "SELECT author, title, ignored_at FROM ignored_books WHERE author = ? ORDER BY ignored_at DESC",
+                (author,),
+            )
+        else:
+            cursor.execute(
+                "SELECT author, title, ignored_at FROM ignored_books ORDER BY ignored_at DESC"
+            )
 
-    books = [
-        {"author": row[0], "title": row[1], "ignored_at": row[2]}
-        for row in cursor.fetchall()
-    ]
+        books = [dict(zip(_IGNORED_BOOK_COLUMNS, row)) for row in cursor]
 
-    conn.close()
     return books
 
 
@@ -1319,27 +1922,25 @@ def get_ignored_books_stats(db_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary with ignored book statistics
     """
-    ensure_ignored_books_table(db_path)
-
-    conn = get_database_connection(db_path)
-    cursor = conn.cursor()
+    _ensure_schema(db_path)
 
-    # Total ignored books
-    cursor.execute("SELECT COUNT(*) FROM ignored_books")
-    total_ignored = cursor.fetchone()[0]
+    with connection_pool.connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    # Authors with ignored books
-    cursor.execute("SELECT COUNT(DISTINCT author) FROM ignored_books")
-    authors_with_ignored = cursor.fetchone()[0]
+        # Total ignored books
+        cursor.execute("SELECT COUNT(*) FROM ignored_books")
+        total_ignored = cursor.fetchone()[0]
 
-    # Recent ignores (last 7 days)
-    cursor.execute("""
-        SELECT COUNT(*) FROM ignored_books 
-        WHERE ignored_at >= datetime('now', '-7 days')
-    """)
-    recent_ignores = cursor.fetchone()[0]
+        # Authors with ignored books
+        cursor.execute("SELECT COUNT(DISTINCT author) FROM ignored_books")
+        authors_with_ignored = cursor.fetchone()[0]
 
-    conn.close()
+        # Recent ignores (last 7 days)
+        cursor.execute("""
+            SELECT COUNT(*) FROM ignored_books 
+            WHERE ignored_at >= datetime('now', '-7 days')
+        """)
+        recent_ignores = cursor.fetchone()[0]
 
     return {
         "total_ignored": total_ignored,
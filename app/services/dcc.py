@@ -4,20 +4,35 @@ DCC (Direct Client-to-Client) Protocol Implementation
 Based on the openbooks project DCC implementation
 """
 
+import mmap
+import os
 import re
 import socket
-import struct
+import time
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+try:
+    # google-re2 matches in linear time with a DFA; optional dependency
+    import re2
+except ImportError:
+    re2 = None
 
-@dataclass
+# Regex pattern for DCC SEND messages
+# Pattern matches: DCC SEND "filename" ip port size
+# The filename class excludes quotes and line breaks to limit backtracking;
+# anchoring the numbers to the end of the line keeps numbers inside an
+# unquoted filename out of the ip, port and size
+DCC_PATTERN = r'DCC SEND "?([^"\r\n]+?)"?\s+(\d+)\s+(\d+)\s+(\d+)\s*\x01?\s*$'
+
+
+@dataclass(slots=True, frozen=True)
 class DCCDownload:
     """Container for DCC download information."""
 
     filename: str
     ip: str
-    port: str
+    port: int
     size: int
     raw_line: str
 
@@ -25,9 +40,18 @@ class DCCDownload:
 class DCCHandler:
     """Handles DCC protocol for file transfers."""
 
-    # Regex pattern for DCC SEND messages
-    # Pattern matches: DCC SEND "filename" ip port size
-    DCC_REGEX = re.compile(r'DCC SEND "?(.+[^"])"?\s+(\d+)\s+(\d+)\s+(\d+)\s*')
+    # Compiled DCC SEND matcher, using RE2 when it is installed
+    DCC_REGEX = re2.compile(DCC_PATTERN) if re2 else re.compile(DCC_PATTERN, re.ASCII)
+
+    # Literal that must appear in any DCC SEND message
+    DCC_PREFIX = "DCC SEND"
+
+    # Seconds a connect or recv may block
+    SOCKET_TIMEOUT = 30
+
+    # Download buffer sizes
+    CHUNK_SIZE = 64 * 1024  # 64KB per recv
+    RECV_BUFFER_SIZE = 1 << 20  # 1MB kernel receive buffer
 
     @classmethod
     def parse_dcc_string(cls, text: str) -> Optional[DCCDownload]:
@@ -40,6 +64,10 @@ class DCCHandler:
         Returns:
             DCCDownload object or None if parsing fails
         """
+        # Cheap substring check rejects ordinary IRC lines before the regex
+        if cls.DCC_PREFIX not in text:
+            return None
+
         match = cls.DCC_REGEX.search(text)
         if not match:
             return None
@@ -47,7 +75,7 @@ class DCCHandler:
         try:
             filename = match.group(1)
             ip_int = int(match.group(2))
-            port = match.group(3)
+            port = int(match.group(3))
             size = int(match.group(4))
 
             # Convert integer IP to dotted decimal notation
@@ -72,17 +100,20 @@ class DCCHandler:
         Returns:
             IP address in dotted decimal notation
         """
-        try:
-            # Pack as big-endian 32-bit unsigned integer, then unpack as 4 bytes
-            packed = struct.pack("!I", ip_int)
-            return socket.inet_ntoa(packed)
-        except (struct.error, socket.error) as e:
-            print(f"[DCC] Error converting IP {ip_int}: {e}")
+        if not 0 <= ip_int <= 0xFFFFFFFF:
+            print(f"[DCC] Error converting IP {ip_int}: out of 32-bit range")
             return "0.0.0.0"
 
+        # Split the big-endian 32-bit value into its four octets
+        return f"{(ip_int >> 24) & 0xFF}.{(ip_int >> 16) & 0xFF}.{(ip_int >> 8) & 0xFF}.{ip_int & 0xFF}"
+
     @classmethod
     def download_file(
-        cls, dcc: DCCDownload, output_path: str, progress_callback=None
+        cls,
+        dcc: DCCDownload,
+        output_path: str,
+        progress_callback=None,
+        deadline: Optional[float] = None,
     ) -> Dict:
         """
         Download file using DCC protocol.
@@ -91,39 +122,83 @@ class DCCHandler:
             dcc: DCCDownload object with connection info
             output_path: Local path to save the file
             progress_callback: Optional callback for progress updates
+            deadline: Optional time.monotonic() value; the transfer stops
+                when it passes, even while waiting on a stalled sender
 
         Returns:
             Dictionary with download result
         """
+        sock = None
+        opened = False
+        complete = False
+        received = 0
         try:
             print(f"[DCC] Connecting to {dcc.ip}:{dcc.port} for {dcc.filename}")
 
             # Connect to DCC server
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(30)  # 30 second timeout
-            sock.connect((dcc.ip, int(dcc.port)))
-
-            # Download file
-            received = 0
-            buffer_size = 4096  # 4KB chunks for optimal performance
-
-            with open(output_path, "wb") as f:
-                while received < dcc.size:
-                    # Read data
-                    data = sock.recv(min(buffer_size, dcc.size - received))
-                    if not data:
-                        break
-
-                    # Write to file
-                    f.write(data)
-                    received += len(data)
-
-                    # Progress callback
-                    if progress_callback:
-                        progress = (received / dcc.size) * 100
-                        progress_callback(received, dcc.size, progress)
-
-            sock.close()
+            sock.settimeout(cls._socket_timeout(deadline))
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, cls.RECV_BUFFER_SIZE)
+            sock.connect((dcc.ip, dcc.port))
+
+            # Report progress every ~1% of the file, at most once per chunk
+            progress_step = max(cls.CHUNK_SIZE, dcc.size // 100)
+            last_reported = 0
+
+            with open(output_path, "w+b", buffering=0) as f:
+                opened = True
+                fd = f.fileno()
+                try:
+                    if cls._prepare_output_file(fd, dcc.size):
+                        # Receive straight into the memory-mapped file,
+                        # skipping the copy from a userspace buffer into write()
+                        mm = mmap.mmap(fd, dcc.size)
+                        view = memoryview(mm)
+                    else:
+                        # Without reserved disk space a full disk would
+                        # surface as SIGBUS on a mapped page, so write()
+                        # from one reusable buffer instead
+                        mm = None
+                        view = memoryview(bytearray(cls.CHUNK_SIZE))
+                    try:
+                        while received < dcc.size:
+                            if deadline is not None:
+                                # Never block in recv past the deadline
+                                sock.settimeout(cls._socket_timeout(deadline))
+                            end = min(received + cls.CHUNK_SIZE, dcc.size)
+                            if mm is not None:
+                                # Read data into the file's pages
+                                chunk = view[received:end]
+                                n = sock.recv_into(chunk)
+                                chunk.release()
+                            else:
+                                # Read data, then write it to the file
+                                n = sock.recv_into(view, end - received)
+                                written = 0
+                                while written < n:
+                                    written += f.write(view[written:n])
+                            if not n:
+                                break
+
+                            received += n
+
+                            # Progress callback
+                            if progress_callback and (
+                                received - last_reported >= progress_step
+                                or received == dcc.size
+                            ):
+                                last_reported = received
+                                progress = (received / dcc.size) * 100
+                                progress_callback(received, dcc.size, progress)
+                    finally:
+                        view.release()
+                        if mm is not None:
+                            mm.close()
+                finally:
+                    # Drop the preallocated tail of an incomplete download,
+                    # however the transfer ended
+                    if received != dcc.size:
+                        os.ftruncate(fd, received)
 
             # Verify download completed
             if received != dcc.size:
@@ -134,6 +209,7 @@ class DCCHandler:
                     "expected": dcc.size,
                 }
 
+            complete = True
             print(f"[DCC] Successfully downloaded {dcc.filename} ({received} bytes)")
 
             return {
@@ -148,7 +224,62 @@ class DCCHandler:
         except Exception as e:
             error_msg = f"DCC download failed: {str(e)}"
             print(f"[DCC] {error_msg}")
-            return {"success": False, "error": error_msg, "filename": dcc.filename}
+            return {
+                "success": False,
+                "error": error_msg,
+                "filename": dcc.filename,
+                "received": received,
+            }
+
+        finally:
+            if sock is not None:
+                sock.close()
+            # A partial file must not pass for a finished download later
+            if opened and not complete:
+                cls._remove_partial_file(output_path)
+
+    @classmethod
+    def _socket_timeout(cls, deadline: Optional[float]) -> float:
+        """Socket timeout for the next blocking call, capped by the deadline."""
+        if deadline is None:
+            return cls.SOCKET_TIMEOUT
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Download deadline passed")
+        return min(cls.SOCKET_TIMEOUT, remaining)
+
+    @staticmethod
+    def _prepare_output_file(fd: int, size: int) -> bool:
+        """
+        Reserve disk space for the whole file and hint sequential access.
+
+        Returns True only when the space is reserved, which is what makes it
+        safe to memory-map the file; both steps are skipped where the
+        platform lacks them.
+        """
+        reserved = False
+        if size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                reserved = True
+            except OSError:
+                pass
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        return reserved
+
+    @staticmethod
+    def _remove_partial_file(output_path: str) -> None:
+        """Delete the output of a failed download, if it is still there."""
+        try:
+            os.remove(output_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[DCC] Could not remove partial file {output_path}: {e}")
 
     @classmethod
     def is_dcc_message(cls, text: str) -> bool:
@@ -161,7 +292,7 @@ class DCCHandler:
         Returns:
             True if message contains DCC SEND
         """
-        return "DCC SEND" in text and cls.DCC_REGEX.search(text) is not None
+        return cls.parse_dcc_string(text) is not None
 
 
 # Utility functions for testing
@@ -5,25 +5,391 @@ Handles IRC connections, book searches, and file downloads with DCC protocol sup
 Based on openbooks project implementation patterns
 """
 
+import asyncio
+import atexit
+import functools
+import heapq
+import io
+import logging
+import math
 import os
-import random
 import re
-import socket
+import shutil
 import ssl  # Add SSL support for TLS connections
 import string
+import sys
 import threading
 import time
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
-
-from .dcc import DCCHandler
+from typing import (
+    Any,
+    Coroutine,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+try:
+    # uvloop runs the shared event loop on libuv; optional dependency
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from .dcc import DCCDownload, DCCHandler
 from .search_parser import SearchResultParser
 
+T = TypeVar("T")
+
+# Per-candidate and per-line diagnostics go here at debug level, so they
+# cost nothing unless debug logging is switched on
+logger = logging.getLogger(__name__)
+
+# Search result lines kept per search: at least this many, or four times the
+# number of results asked for, so a noisy channel can't grow the buffer forever
+SEARCH_RESULTS_MIN_BUFFER = 1000
+
+# DCC offers kept per session; downloads only ever use the latest one
+DCC_OFFERS_BUFFER = 8
+
+# Book listing line formats, tried in order (following openbooks parseLineV2)
+ENHANCED_LINE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # openbooks v2 format: !server author - title.ext ::INFO:: size
+        r"^!([^>]+)\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+::INFO::\s+(.+)$",
+        # openbooks v1 format: !server author - title.ext size
+        r"^!([^>]+)\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+(.+)$",
+        # Alternative format: <!server> author - title.ext size
+        r"^<!([^>]+)>\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+(.+)$",
+        # Simple format: server author - title.ext size
+        r"^([^!\s]+)\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+(.+)$",
+    )
+)
+
+# All listing formats in one alternation; each format has five groups, so the
+# last group that matched tells which format it was
+ENHANCED_LINE_REGEX = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in ENHANCED_LINE_PATTERNS),
+    re.IGNORECASE,
+)
+
+# File size patterns found in the info part of a listing line
+SIZE_INFO_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(\d+(?:\.\d+)?\s*[KMGT]?B)",  # Standard: 1.2MB, 500KB, etc.
+        r"(\d+(?:\.\d+)?\s*[KMGT])",  # Without B: 1.2M, 500K
+        r"(\d+(?:,\d+)*\s*bytes?)",  # Bytes: 1,234,567 bytes
+    )
+)
+# Just the standard form, used by the "<!server>" line parser
+SIZE_REGEX = SIZE_INFO_PATTERNS[0]
+
+# Extensions the "<!server>" line parser looks for, in order of preference
+BOOK_LINE_EXTENSIONS = ("epub", "mobi", "azw3", "pdf", "txt", "html", "rtf")
+
+# Number and unit of an upper-cased size string
+SIZE_UNIT_REGEX = re.compile(r"(\d+(?:\.\d+)?)\s*([KMGT]?B)")
+SIZE_MB_REGEX = re.compile(r"(\d+(?:\.\d+)?)([KMGT]?B?)")
+SIZE_CLEAN_REGEX = re.compile(r"[,\s]+")
+SIZE_SCORE_REGEX = re.compile(r"(\d+(?:\.\d+)?)\s*([KMGT]?B?)")
+
+# Megabytes per unit of a size string, with or without the trailing B
+SIZE_MB_MULTIPLIERS = {
+    "B": 0.000001,
+    "KB": 0.001,
+    "K": 0.001,
+    "MB": 1.0,
+    "M": 1.0,
+    "GB": 1000.0,
+    "G": 1000.0,
+    "TB": 1000000.0,
+    "T": 1000000.0,
+}
+
+# Extensions accepted as ebooks in listing files
+EBOOK_EXTENSIONS = frozenset(
+    {
+        "epub",
+        "mobi",
+        "azw",
+        "azw3",
+        "pdf",
+        "txt",
+        "html",
+        "htm",
+        "rtf",
+        "doc",
+        "docx",
+        "lit",
+        "pdb",
+        "fb2",
+        "djvu",
+        "chm",
+    }
+)
+
+# Ranking bonus per lower-case extension (EPUB highest)
+FORMAT_PREFERENCE_SCORES = {
+    "epub": 15.0,  # Highest preference
+    "mobi": 10.0,
+    "azw3": 8.0,
+    "pdf": 5.0,
+    "html": 3.0,
+    "txt": 2.0,
+    "rtf": 1.0,
+}
+
+# Format bonuses for the simple author and title scores (epub > mobi > others)
+AUTHOR_FORMAT_BONUS = {"epub": 5.0, "mobi": 3.0, "azw3": 2.0}
+TITLE_FORMAT_BONUS = {"epub": 3.0, "mobi": 2.0, "azw3": 1.0}
+
+# Format bonus when choosing between download candidates (EPUB highest)
+CANDIDATE_FORMAT_SCORES = {
+    "epub": 30.0,
+    "mobi": 20.0,
+    "azw3": 15.0,
+    "pdf": 10.0,
+    "txt": 5.0,
+}
+
+# Title words that mark a good release when there is no version marker
+QUALITY_INDICATORS = ("retail", "final", "complete", "unabridged", "original")
+
+# Query fragments that suggest an author search or a title search
+AUTHOR_QUERY_INDICATORS = ("by ", "author:", "written by", ".", ",")
+TITLE_QUERY_INDICATORS = ("the ", "a ", "an ", "book:", "title:")
+
+# Bits recording which parts of a book matched a query, and their labels
+MATCH_AUTHOR = 1
+MATCH_TITLE = 2
+MATCH_LABELS = ("general", "author", "title", "author+title")
+
+# Punctuation dropped when splitting names, titles and queries into words
+WORD_PUNCTUATION = str.maketrans("", "", ",.;:!?\"'()[]")
+
+# Leading articles and bracketed or versioned noise stripped from titles
+# before grouping and matching them
+TITLE_ARTICLE_PREFIXES = ("the ", "a ", "an ")
+TITLE_NOISE_REGEX = re.compile(r"\s*(?:\([^)]*\)|\[[^\]]*\]|v\d+)\s*", re.IGNORECASE)
+TITLE_SPACE_REGEX = re.compile(r"\s+")
+
+# Version markers ranked when choosing between download candidates
+CANDIDATE_VERSION_REGEX = re.compile(r"v([1-5])")
+
+# Share of distinct words two normalized titles need in common to match
+TITLE_MATCH_SIMILARITY = 0.7
+
+# Encodings tried for listing text files; the last one never fails
+TEXT_FILE_ENCODINGS = ("utf-8-sig", "latin-1")
+
+# Bytes inflated and decoded per read while streaming a listing text file
+TEXT_READ_CHUNK_SIZE = 1 << 16
+
+# Threads inflating text files from search result archives, shared by every session
+ZIP_READ_WORKERS = 4
+
+# Threads running downloads under a timeout, shared by every session
+DOWNLOAD_WORKERS = 8
+
+# Seconds a download past its deadline gets to stop before it is abandoned
+DOWNLOAD_DEADLINE_GRACE = 5
+
+# Buffer used when streaming archive members to disk
+ZIP_COPY_BUFFER_SIZE = 1 << 20
+
+# Building blocks for random nicknames; eight of each so three bits pick one
+NICK_ADJECTIVES = ("Dark", "Web", "Quick", "Silent", "Swift", "Digital", "Cyber", "Net")
+NICK_NOUNS = ("Horse", "Wolf", "Eagle", "Lion", "Hawk", "Fox", "Bear", "Tiger")
+# Every two-letter suffix, so one index picks both letters
+NICK_SUFFIXES = tuple(
+    a + b for a in string.ascii_lowercase for b in string.ascii_lowercase
+)
+
+
+# Shared event loop that runs the network I/O of every IRC session
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_event_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared IRC event loop, starting its thread on first use."""
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = (
+                uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            )
+            threading.Thread(
+                target=_event_loop.run_forever, name="irc-event-loop", daemon=True
+            ).start()
+        return _event_loop
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared IRC event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+# Worker threads shared by every IRC session. Threads start on first use
+# and are reused afterwards; queued work is dropped when the process exits.
+_download_pool = ThreadPoolExecutor(
+    max_workers=DOWNLOAD_WORKERS, thread_name_prefix="irc-download"
+)
+_listing_pool = ThreadPoolExecutor(
+    max_workers=ZIP_READ_WORKERS, thread_name_prefix="irc-listing"
+)
+atexit.register(_download_pool.shutdown, wait=False, cancel_futures=True)
+atexit.register(_listing_pool.shutdown, wait=False, cancel_futures=True)
+
+
+# TLS sessions from earlier connections, keyed by server hostname
+_tls_sessions: Dict[str, ssl.SSLSession] = {}
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """SSL context that offers the cached session when reconnecting to a server."""
+
+    def wrap_bio(
+        self,
+        incoming,
+        outgoing,
+        server_side=False,
+        server_hostname=None,
+        session=None,
+    ):
+        # asyncio never passes a session, so resume from the cache here
+        if session is None and not server_side:
+            session = _tls_sessions.get(server_hostname)
+        return super().wrap_bio(
+            incoming, outgoing, server_side, server_hostname, session
+        )
+
+
+def _create_tls_context() -> ssl.SSLContext:
+    """Create the client TLS context shared by all IRC sessions."""
+    context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    # Like openbooks, don't verify the server certificate
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    return context
+
+
+_TLS_CONTEXT = _create_tls_context()
+
+
+def _word_set(text_lower: str) -> FrozenSet[str]:
+    """Split lower-case text into its words, ignoring punctuation."""
+    return frozenset(text_lower.translate(WORD_PUNCTUATION).split())
+
+
+def _match_book_line(line: str) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the fields of each listing format that matches the line, in order.
+
+    One match against the combined regex finds the first format; the later
+    formats are only tried when the caller rejects that match.
+    """
+    match = ENHANCED_LINE_REGEX.match(line)
+    if not match:
+        return
+
+    first = (match.lastindex - 1) // 5
+    yield match.groups()[first * 5 : first * 5 + 5]
+    for pattern in ENHANCED_LINE_PATTERNS[first + 1 :]:
+        match = pattern.match(line)
+        if match:
+            yield match.groups()
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_title_cached(title: str) -> str:
+    """Normalize a title; the same titles come back from many servers."""
+    normalized = title.lower().strip()
+
+    # Remove common prefixes/suffixes
+    if normalized.startswith(TITLE_ARTICLE_PREFIXES):
+        for prefix in TITLE_ARTICLE_PREFIXES:
+            if normalized.startswith(prefix):
+                normalized = normalized[len(prefix) :]
+
+    # Remove parentheses and brackets content and version numbers in one pass
+    normalized = TITLE_NOISE_REGEX.sub(" ", normalized)
+    return TITLE_SPACE_REGEX.sub(" ", normalized).strip()  # Whitespace
+
+
+@functools.lru_cache(maxsize=1024)
+def _size_scoring_value(size_str: str) -> float:
+    """Score a candidate's size string; sizes repeat across servers."""
+    try:
+        # Extract number and unit
+        match = SIZE_SCORE_REGEX.match(size_str.upper())
+        if not match:
+            return 0.0
+
+        number = float(match.group(1))
+        unit = match.group(2) or "B"
+
+        # Convert to MB for scoring
+        size_mb = number * SIZE_MB_MULTIPLIERS.get(unit, 1.0)
+
+        # Logarithmic scoring with reasonable ebook size preference
+        base_score = math.log10(max(size_mb, 0.1)) * 10.0
+
+        # Bonus for reasonable ebook sizes (0.5MB - 50MB)
+        if 0.5 <= size_mb <= 50:
+            base_score += 20.0
+        elif size_mb > 100:
+            base_score -= 10.0  # Penalty for very large files
+
+        return max(base_score, 0.0)
+
+    except Exception:
+        return 0.0
+
+
+@dataclass(slots=True)
+class ListingBook:
+    """Book parsed from a search result listing file."""
+
+    server: str
+    author: str
+    title: str
+    # Lower-cased once here instead of in every scoring helper
+    author_lower: str
+    title_lower: str
+    extension: str
+    size: str
+    # Parsed from size once; 0.0 when it is missing or unreadable
+    size_mb: float
+    raw_line: str
+    # Shared by every book from the same file
+    source_file: str
+    full_command: str
+    # Word sets for query matching, built once instead of per query
+    author_words: FrozenSet[str]
+    title_words: FrozenSet[str]
+    # Version and quality bonus doesn't depend on the query
+    version_score: float
+
 
 class IRCSession:
     """Manages a persistent IRC session for downloading multiple files."""
 
+    # File extensions (without the dot) that mark a line as a search result
+    _EXT_SET = frozenset({b"epub", b"pdf", b"mobi", b"txt", b"zip", b"rar"})
+
     def __init__(
         self,
         server: str = "irc.irchighway.net",
@@ -71,33 +437,36 @@ class IRCSession:
             "tls_enabled": self.enable_tls,
         }
 
-        # Response handling
-        self._response_buffer = []
-        self._response_lock = threading.Lock()
-        self._listener_thread = None
-        self._running = False
+        # Connection streams, driven by the shared IRC event loop
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+        # The channel is fixed per session, so encode the message prefix once
+        self._privmsg_prefix = f"PRIVMSG {self.channel} :".encode()
+
+        # Response handling; events are set by the listener as lines arrive
+        self._rx_buf = bytearray()
+        self._search_results: Deque[str] = deque(maxlen=SEARCH_RESULTS_MIN_BUFFER)
+        self._dcc_offers: Deque[DCCDownload] = deque(maxlen=DCC_OFFERS_BUFFER)
+        self._results_wanted = 0
+        self._search_results_event = asyncio.Event()
+        self._dcc_offer_event = asyncio.Event()
 
     def _generate_random_nickname(self) -> str:
         """Generate a random nickname for IRC connection."""
-        adjectives = [
-            "Dark",
-            "Web",
-            "Quick",
-            "Silent",
-            "Swift",
-            "Digital",
-            "Cyber",
-            "Net",
-        ]
-        nouns = ["Horse", "Wolf", "Eagle", "Lion", "Hawk", "Fox", "Bear", "Tiger"]
-        numbers = random.randint(100, 999)
-
-        base = f"{random.choice(adjectives)}{random.choice(nouns)}{numbers}"
-        # Add some random characters if needed
-        if random.choice([True, False]):
-            base += random.choice(["_", ""]) + "".join(
-                random.choices(string.ascii_lowercase, k=2)
-            )
+        # One urandom call supplies the name fields via non-overlapping bit slices
+        r = int.from_bytes(os.urandom(4), "big")
+        adjective = NICK_ADJECTIVES[r & 7]
+        noun = NICK_NOUNS[(r >> 3) & 7]
+        number = (r >> 8) % 900 + 100
+
+        base = f"{adjective}{noun}{number}"
+        # Add some random characters half of the time
+        if r & (1 << 6):
+            separator = "_" if r & (1 << 7) else ""
+            suffix = int.from_bytes(os.urandom(2), "big") % len(NICK_SUFFIXES)
+            base += separator + NICK_SUFFIXES[suffix]
 
         return base[:16]  # IRC nickname length limit
 
@@ -114,34 +483,37 @@ class IRCSession:
 
     def connect(self) -> bool:
         """Connect to IRC server and join channel with TLS support and retry logic."""
+        return _run_coroutine(self._connect())
+
+    async def _connect(self) -> bool:
+        """Open the connection, register and join the channel on the event loop."""
         max_retries = 3
         retry_count = 0
 
         while retry_count < max_retries:
             try:
-                # Create socket with optional TLS support (like openbooks)
+                # Create connection with optional TLS support (like openbooks)
                 if self.enable_tls:
-                    context = ssl.create_default_context()
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                    raw_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    self.socket = context.wrap_socket(raw_socket)
+                    context = _TLS_CONTEXT
                     print(
                         f"[IRC] Connecting to {self.server}:{self.port} with TLS as {self.nickname}..."
                     )
                 else:
-                    self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    context = None
                     print(
                         f"[IRC] Connecting to {self.server}:{self.port} as {self.nickname}..."
                     )
 
-                self.socket.settimeout(self.connect_timeout)
-                self.socket.connect((self.server, self.port))
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.server, self.port, ssl=context),
+                    timeout=self.connect_timeout,
+                )
+                self.socket = self._writer.get_extra_info("socket")
 
-                # Send connection commands (same as openbooks)
-                self.socket.send(f"NICK {self.nickname}\r\n".encode())
-                self.socket.send(
-                    f"USER {self.nickname} 0 * :{self.real_name}\r\n".encode()
+                # Send connection commands (same as openbooks) in a single write
+                await self._send(
+                    f"NICK {self.nickname}\r\n"
+                    f"USER {self.nickname} 0 * :{self.real_name}\r\n"
                 )
 
                 # Wait for connection confirmation with improved error handling
@@ -151,8 +523,8 @@ class IRCSession:
 
                 while not connected and nick_retries < max_nick_retries:
                     try:
-                        resp = self.socket.recv(2048).decode(errors="ignore")
-                        print(f"[IRC] {resp.strip()}")
+                        resp = await self._read(2048, self.connect_timeout)
+                        logger.debug("%s", resp.strip())
 
                         # Handle different response codes
                         if "004" in resp or "Welcome" in resp:
@@ -164,16 +536,12 @@ class IRCSession:
                             print(
                                 f"[IRC] Nickname {old_nick} in use, trying: {self.nickname}"
                             )
-                            self.socket.send(f"NICK {self.nickname}\r\n".encode())
+                            await self._send(f"NICK {self.nickname}\r\n")
                             nick_retries += 1
                         elif "ERROR" in resp or "Closing Link" in resp:
                             raise Exception(f"IRC connection error: {resp}")
-                        elif "PING" in resp:
-                            # Handle PING during connection
-                            pong_response = resp.replace("PING", "PONG")
-                            self.socket.send(pong_response.encode())
 
-                    except socket.timeout:
+                    except asyncio.TimeoutError:
                         nick_retries += 1
                         if nick_retries >= max_nick_retries:
                             raise Exception("Connection timeout during registration")
@@ -181,11 +549,12 @@ class IRCSession:
                 if not connected:
                     raise Exception("Failed to register nickname after maximum retries")
 
-                # Wait before joining (like openbooks does)
-                time.sleep(2)
+                # Session tickets have arrived by now; keep one for reconnects
+                self._remember_tls_session()
 
-                # Join channel
-                self.socket.send(f"JOIN {self.channel}\r\n".encode())
+                # Join channel as soon as registration is confirmed; servers
+                # reject JOIN from clients that haven't registered yet
+                await self._send(f"JOIN {self.channel}\r\n")
 
                 # Wait for join confirmation
                 join_confirmed = False
@@ -194,17 +563,14 @@ class IRCSession:
 
                 while not join_confirmed and (time.time() - join_start) < join_timeout:
                     try:
-                        resp = self.socket.recv(2048).decode(errors="ignore")
-                        if resp:
-                            print(f"[IRC] {resp.strip()}")
-                            if (
-                                f"JOIN {self.channel}" in resp or "366" in resp
-                            ):  # End of NAMES list
-                                join_confirmed = True
-                            elif "PING" in resp:
-                                pong_response = resp.replace("PING", "PONG")
-                                self.socket.send(pong_response.encode())
-                    except socket.timeout:
+                        remaining = join_timeout - (time.time() - join_start)
+                        resp = await self._read(2048, max(remaining, 0.1))
+                        logger.debug("%s", resp.strip())
+                        if (
+                            f"JOIN {self.channel}" in resp or "366" in resp
+                        ):  # End of NAMES list
+                            join_confirmed = True
+                    except asyncio.TimeoutError:
                         continue
 
                 if not join_confirmed:
@@ -235,18 +601,13 @@ class IRCSession:
                 error_msg = f"Connection attempt {retry_count + 1} failed: {str(e)}"
                 print(f"[IRC] {error_msg}")
 
-                if self.socket:
-                    try:
-                        self.socket.close()
-                    except Exception:
-                        pass
-                    self.socket = None
+                self._close_connection()
 
                 retry_count += 1
                 if retry_count < max_retries:
                     sleep_time = 5 * retry_count  # Progressive backoff
                     print(f"[IRC] Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+                    await asyncio.sleep(sleep_time)
                 else:
                     self._update_status(
                         {
@@ -260,52 +621,120 @@ class IRCSession:
 
         return False
 
+    def _remember_tls_session(self) -> None:
+        """Cache the TLS session so the next connection can resume it."""
+        ssl_object = self._writer.get_extra_info("ssl_object")
+        if ssl_object is None or ssl_object.session is None:
+            return
+
+        if ssl_object.session_reused:
+            print(f"[IRC] Resumed TLS session with {self.server}")
+        _tls_sessions[self.server] = ssl_object.session
+        self._update_status({"tls_session_reused": ssl_object.session_reused})
+
+    async def _send(self, message: str) -> None:
+        """Write a raw IRC message and wait until it has been flushed."""
+        self._writer.write(message.encode())
+        await self._writer.drain()
+
+    async def _send_privmsg(self, text: str) -> None:
+        """Send a message to the session's channel."""
+        self._writer.write(self._privmsg_prefix + text.encode() + b"\r\n")
+        await self._writer.drain()
+
+    async def _read(self, size: int, timeout: float) -> str:
+        """Read up to size bytes, raising if the server closed the connection.
+
+        PINGs in the data are answered before it is handed back.
+        """
+        data = await asyncio.wait_for(self._reader.read(size), timeout=timeout)
+        if not data:
+            raise ConnectionError("Connection closed by server")
+        for frame in data.split(b"\n"):
+            self._handle_ping(frame.strip())
+        return data.decode(errors="ignore")
+
+    def _handle_ping(self, frame: bytes) -> bool:
+        """Answer a PING frame with the matching PONG; return whether it was one."""
+        if not frame.startswith(b"PING "):
+            return False
+        self._writer.write(b"PONG " + frame[5:] + b"\r\n")
+        return True
+
+    def _close_connection(self) -> None:
+        """Close the stream and forget the connection."""
+        if self._writer:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+        self._reader = None
+        self._writer = None
+        self.socket = None
+
     def _start_response_listener(self) -> None:
-        """Start background thread to listen for IRC responses."""
+        """Start the background task that listens for IRC responses."""
+        self._rx_buf.clear()
+        self._listener_task = asyncio.get_running_loop().create_task(self._listener())
 
-        def listener():
-            while self.connected and self.socket:
-                try:
-                    self.socket.settimeout(1)
-                    resp = self.socket.recv(4096).decode(errors="ignore")
-                    if resp:
-                        # Handle PING/PONG to stay connected
-                        if "PING" in resp:
-                            pong_response = resp.replace("PING", "PONG")
-                            self.socket.send(pong_response.encode())
-
-                        # Store response for processing
-                        self._process_irc_response(resp)
-                        print(f"[IRC] {resp.strip()}")
-                    else:
-                        break
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    print(f"[IRC] Listener error: {e}")
+    async def _listener(self) -> None:
+        """Read and process IRC responses until the connection closes."""
+        while self.connected and self._reader:
+            try:
+                data = await self._reader.read(4096)
+                if not data:
                     break
 
-        thread = threading.Thread(target=listener, daemon=True)
-        thread.start()
-
-    def _process_irc_response(self, response: str) -> None:
-        """Process IRC responses for search results, DCC offers, and CTCP requests."""
-        lines = response.strip().split("\n")
+                # Dispatch every complete line; a partial line stays buffered
+                # until the rest of it arrives
+                self._rx_buf += data
+                start = 0
+                while (end := self._rx_buf.find(b"\n", start)) != -1:
+                    line = bytes(self._rx_buf[start:end]).strip()
+                    start = end + 1
+                    if line:
+                        self._process_irc_line(line)
+                del self._rx_buf[:start]
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[IRC] Listener error: {e}")
+                break
 
-        for line in lines:
-            line = line.strip()
+        # The server went away; let callers see the session is dead
+        if self.connected:
+            self.connected = False
+            self.joined_channel = False
+            self._update_status({"connected": False, "joined_channel": False})
 
-            # Handle CTCP VERSION requests (important for IRC Highway allow-listing)
-            if "\x01VERSION\x01" in line:
-                self._handle_version_request(line)
+    def _process_irc_line(self, line: bytes) -> None:
+        """Process one IRC line for PINGs, search results, DCC offers, and CTCP requests."""
+        # Handle PING/PONG to stay connected
+        self._handle_ping(line)
 
-            # Check for DCC SEND offers
-            if DCCHandler.is_dcc_message(line):
-                self._handle_dcc_offer(line)
+        text = line.decode(errors="ignore")
+        logger.debug("%s", text)
 
+        # Search results are bare "!bot ..." lines, while CTCP requests and DCC
+        # offers arrive as ":prefix" messages, so each line gets one kind of scan
+        if line.startswith(b"!"):
             # Store potential search results
             if self._is_potential_search_result(line):
-                self._store_search_result(line)
+                self._store_search_result(text)
+            return
+
+        # PINGs and server notices without a prefix carry no CTCP or DCC
+        if not line.startswith(b":"):
+            return
+
+        # Handle CTCP VERSION requests (important for IRC Highway allow-listing);
+        # the single-byte \x01 scan skips the full search for plain chatter
+        if b"\x01" in line and b"\x01VERSION\x01" in line:
+            self._handle_version_request(text)
+
+        # Check for DCC SEND offers (parsed once; non-DCC lines are ignored)
+        elif b"DCC SEND" in line:
+            self._handle_dcc_offer(text)
 
     def _handle_version_request(self, line: str) -> None:
         """Handle CTCP VERSION requests (critical for IRC Highway allow-listing)."""
@@ -320,8 +749,8 @@ class IRCSession:
                 version_response = (
                     f"NOTICE {sender} :\x01VERSION {self.user_agent}\x01\r\n"
                 )
-                if self.socket:
-                    self.socket.send(version_response.encode())
+                if self._writer:
+                    self._writer.write(version_response.encode())
                     print(
                         f"[IRC] Sent CTCP VERSION response to {sender}: {self.user_agent}"
                     )
@@ -334,22 +763,30 @@ class IRCSession:
         if dcc:
             print(f"[IRC] DCC offer received: {dcc.filename} ({dcc.size} bytes)")
             # Store DCC offer for potential download
-            if not hasattr(self, "_dcc_offers"):
-                self._dcc_offers = []
             self._dcc_offers.append(dcc)
+            self._dcc_offer_event.set()
 
-    def _is_potential_search_result(self, line: str) -> bool:
+    def _is_potential_search_result(self, line: bytes) -> bool:
         """Check if line might be a search result."""
-        return line.startswith("!") and any(
-            ext in line.lower()
-            for ext in [".epub", ".pdf", ".mobi", ".txt", ".zip", ".rar"]
-        )
+        if not line.startswith(b"!"):
+            return False
+
+        # Compare the bytes after each dot against the known extensions
+        dot = line.find(b".")
+        while dot != -1:
+            if (
+                line[dot + 1 : dot + 4].lower() in self._EXT_SET
+                or line[dot + 1 : dot + 5].lower() in self._EXT_SET
+            ):
+                return True
+            dot = line.find(b".", dot + 1)
+        return False
 
     def _store_search_result(self, line: str) -> None:
         """Store potential search result."""
-        if not hasattr(self, "_search_results"):
-            self._search_results = []
         self._search_results.append(line)
+        if len(self._search_results) >= self._results_wanted:
+            self._search_results_event.set()
 
     def _enforce_rate_limit(self) -> None:
         """Enforce rate limiting between commands."""
@@ -372,10 +809,6 @@ class IRCSession:
 
         self._enforce_rate_limit()
 
-        # Clear previous search results
-        self._search_results = []
-        self._dcc_offers = []
-
         # Format search command (based on openbooks patterns)
         # Use configurable search bot prefix
         if title:
@@ -387,36 +820,18 @@ class IRCSession:
 
         print(f"[IRC] Searching with bot '{self.search_bot}': {search_query}")
 
-        # Send search command to the channel
-        try:
-            self.socket.send(f"PRIVMSG {self.channel} :{search_query}\r\n".encode())
-        except Exception as e:
-            raise Exception(f"Failed to send search command: {e}")
-
-        # Wait for search results (following openbooks timeout pattern)
-        print("[IRC] Waiting for search results...")
-        start_time = time.time()
+        # Send search command to the channel and wait for search results
+        # (following openbooks timeout pattern)
         timeout = 20  # Increased timeout like openbooks
-
-        while time.time() - start_time < timeout:
-            time.sleep(1)
-            # Check if we've received enough results
-            if (
-                hasattr(self, "_search_results")
-                and len(self._search_results) >= max_results
-            ):
-                print(
-                    f"[IRC] Received {len(self._search_results)} results, stopping collection"
-                )
-                break
+        raw_results = _run_coroutine(
+            self._request_search_results(search_query, max_results, timeout)
+        )
 
         # Parse collected results
-        if hasattr(self, "_search_results") and self._search_results:
-            print(f"[IRC] Processing {len(self._search_results)} raw results")
+        if raw_results:
+            print(f"[IRC] Processing {len(raw_results)} raw results")
 
-            books, parse_errors = self.search_parser.parse_search_results(
-                self._search_results
-            )
+            books, parse_errors = self.search_parser.parse_search_results(raw_results)
 
             # Filter results if specific criteria provided (following openbooks filtering)
             if author or title:
@@ -432,19 +847,22 @@ class IRCSession:
                 books = books[:max_results]
                 print(f"[IRC] Limited results to {max_results}")
 
-            # Convert to dict format for API compatibility
+            # Convert to dict format for API compatibility; a handful of bots
+            # and formats repeat across every result, so share one string each.
+            # All results arrived in the same search window and share a timestamp
+            parsed_at = datetime.now().isoformat()
             results = []
             for book in books:
                 results.append(
                     {
-                        "server": book.server,
+                        "server": sys.intern(book.server),
                         "author": book.author,
                         "title": book.title,
-                        "format": book.format,
+                        "format": sys.intern(book.format),
                         "size": book.size,
                         "download_command": book.full_command,
                         "raw_line": book.raw_line,
-                        "parsed_at": datetime.now().isoformat(),
+                        "parsed_at": parsed_at,
                         "search_query": search_query,  # Track what was searched
                     }
                 )
@@ -472,111 +890,70 @@ class IRCSession:
             print(f"[IRC] No search results received for '{search_query}'")
             return []
 
-    def _is_search_result(self, line: str) -> bool:
-        """Check if a line contains a search result."""
-        # Look for common patterns in IRC search results
-        patterns = [
-            r"!\w+\s+",  # Bot name followed by space
-            r"\d+\.\s*",  # Numbered results
-            r"\[.*\]",  # Results in brackets
-            r"<.*>",  # Results in angle brackets
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, line) and any(
-                ext in line.lower()
-                for ext in [".epub", ".pdf", ".mobi", ".txt", ".zip"]
-            ):
-                return True
-        return False
-
-    def _parse_search_result(self, line: str) -> Optional[Dict]:
-        """Parse a search result line into structured data."""
-        try:
-            # Extract filename and other info
-            # This is a simplified parser - may need adjustment based on actual IRC bot responses
-
-            # Look for common file extensions
-            extensions = [".epub", ".pdf", ".mobi", ".txt", ".zip"]
-            filename = None
-
-            for ext in extensions:
-                if ext in line.lower():
-                    # Find the filename around the extension
-                    parts = line.split()
-                    for part in parts:
-                        if ext in part.lower():
-                            filename = part.strip("[]()<>")
-                            break
-                    break
+    async def _request_search_results(
+        self, search_query: str, max_results: int, timeout: float
+    ) -> List[str]:
+        """
+        Send a search and wait until enough results arrive or time runs out.
 
-            if filename:
-                return {
-                    "raw_line": line,
-                    "filename": filename,
-                    "download_command": line.strip(),  # The exact line to send back for download
-                    "parsed_at": datetime.now().isoformat(),
-                }
+        Results are only mutated on the event loop, so the snapshot returned
+        here can't race with the listener appending more lines.
+        """
+        # Start a fresh bounded buffer sized for this search
+        self._search_results = deque(
+            maxlen=max(SEARCH_RESULTS_MIN_BUFFER, max_results * 4)
+        )
+        self._dcc_offers.clear()
+        self._results_wanted = max_results
+        self._search_results_event.clear()
 
+        try:
+            await self._send_privmsg(search_query)
         except Exception as e:
-            print(f"[IRC] Error parsing result: {e}")
+            raise Exception(f"Failed to send search command: {e}")
 
-        return None
+        print("[IRC] Waiting for search results...")
+        try:
+            await asyncio.wait_for(self._search_results_event.wait(), timeout)
+            print(
+                f"[IRC] Received {len(self._search_results)} results, stopping collection"
+            )
+        except asyncio.TimeoutError:
+            pass
+
+        return list(self._search_results)
 
     def download_file(
         self,
         download_command: str,
         custom_filename: Optional[str] = None,
         search_query: str = "",
+        deadline: Optional[float] = None,
     ) -> Dict:
-        """Download a file using DCC protocol from IRC."""
+        """
+        Download a file using DCC protocol from IRC.
+
+        deadline is an optional time.monotonic() value; waiting for the offer
+        and the transfer itself both stop when it passes.
+        """
         if not self.connected or not self.socket:
             raise Exception("Not connected to IRC")
 
         self._enforce_rate_limit()
 
-        print(f"[IRC] Requesting download: {download_command}")
+        offer_timeout = self.response_timeout
+        if deadline is not None:
+            offer_timeout = min(offer_timeout, deadline - time.monotonic())
+            if offer_timeout <= 0:
+                return {"success": False, "error": "Download deadline passed"}
 
-        # Clear any previous DCC offers
-        if hasattr(self, "_dcc_offers"):
-            self._dcc_offers.clear()
-        else:
-            self._dcc_offers = []
+        print(f"[IRC] Requesting download: {download_command}")
 
         # Send the download command (usually the exact line from search results)
-        self.socket.send(f"PRIVMSG {self.channel} :{download_command}\r\n".encode())
-
-        # Wait for DCC SEND offer
-        dcc_offer = None
-        self.socket.settimeout(
-            self.response_timeout
-        )  # Use response timeout for DCC offer
-
-        start_time = time.time()
-        while time.time() - start_time < self.response_timeout:
-            try:
-                resp = self.socket.recv(4096).decode(errors="ignore")
-                if resp:
-                    print(f"[IRC] Response: {resp.strip()}")
-
-                    # Handle PING/PONG
-                    if "PING" in resp:
-                        pong_response = resp.replace("PING", "PONG")
-                        self.socket.send(pong_response.encode())
-
-                    # Process response for DCC offers
-                    self._process_irc_response(resp)
-
-                    # Check if we got a DCC offer
-                    if hasattr(self, "_dcc_offers") and self._dcc_offers:
-                        dcc_offer = self._dcc_offers[-1]  # Get latest offer
-                        print(f"[IRC] Got DCC offer: {dcc_offer.filename}")
-                        break
-            except socket.timeout:
-                break
-            except Exception as e:
-                print(f"[IRC] Download request error: {e}")
-                break
+        # and wait for the DCC SEND offer
+        dcc_offer = _run_coroutine(
+            self._request_dcc_offer(download_command, offer_timeout)
+        )
 
         if not dcc_offer:
             error_msg = "No DCC offer received"
@@ -597,7 +974,9 @@ class IRCSession:
             print(f"[IRC] Downloading via DCC to: {file_path}")
 
             # Use DCCHandler to perform the download
-            download_result = DCCHandler.download_file(dcc_offer, file_path)
+            download_result = DCCHandler.download_file(
+                dcc_offer, file_path, deadline=deadline
+            )
 
             if download_result.get("success", False):
                 downloaded_size = download_result.get("size", 0)
@@ -641,6 +1020,25 @@ class IRCSession:
             print(f"[IRC] {error_msg}")
             return {"success": False, "error": error_msg}
 
+    async def _request_dcc_offer(
+        self, download_command: str, timeout: float
+    ) -> Optional[DCCDownload]:
+        """Send a download command and wait for the resulting DCC offer."""
+        # Clear any previous DCC offers
+        self._dcc_offers.clear()
+        self._dcc_offer_event.clear()
+
+        await self._send_privmsg(download_command)
+
+        try:
+            await asyncio.wait_for(self._dcc_offer_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        dcc_offer = self._dcc_offers[-1]  # Get latest offer
+        print(f"[IRC] Got DCC offer: {dcc_offer.filename}")
+        return dcc_offer
+
     def _extract_zip(self, zip_path: str, search_query: str = "") -> List[str]:
         """
         Extract a zip file and return list of extracted EPUB files with enhanced text file parsing.
@@ -649,7 +1047,6 @@ class IRCSession:
         extracted_files = []
         try:
             extract_dir = os.path.splitext(zip_path)[0] + "_extracted"
-            os.makedirs(extract_dir, exist_ok=True)
 
             with zipfile.ZipFile(zip_path, "r") as zip_file:
                 file_list = zip_file.namelist()
@@ -693,8 +1090,9 @@ class IRCSession:
                     # Extract only EPUB files to save space
                     for epub_file in epub_files:
                         try:
-                            zip_file.extract(epub_file, extract_dir)
-                            extracted_path = os.path.join(extract_dir, epub_file)
+                            extracted_path = self._copy_zip_member(
+                                zip_file, epub_file, extract_dir
+                            )
                             extracted_files.append(extracted_path)
                             print(f"[IRC] Extracted: {epub_file}")
                         except Exception as e:
@@ -723,8 +1121,9 @@ class IRCSession:
                         :10
                     ]:  # Limit to 10 files to prevent spam
                         try:
-                            zip_file.extract(ebook_file, extract_dir)
-                            extracted_path = os.path.join(extract_dir, ebook_file)
+                            extracted_path = self._copy_zip_member(
+                                zip_file, ebook_file, extract_dir
+                            )
                             extracted_files.append(extracted_path)
                         except Exception as e:
                             print(f"[IRC] Failed to extract {ebook_file}: {e}")
@@ -745,6 +1144,21 @@ class IRCSession:
 
         return extracted_files
 
+    def _copy_zip_member(
+        self, zip_file: zipfile.ZipFile, name: str, extract_dir: str
+    ) -> str:
+        """Stream one archive member to extract_dir using large sequential writes."""
+        root = os.path.realpath(extract_dir)
+        target = os.path.realpath(os.path.join(root, name))
+        # Refuse members such as "../x" that would land outside extract_dir
+        if os.path.commonpath([root, target]) != root:
+            raise ValueError(f"Unsafe path in archive: {name}")
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with zip_file.open(name) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER_SIZE)
+        return target
+
     def _parse_text_files_from_zip(
         self, zip_file, txt_files: List[str], search_query: str
     ) -> List[str]:
@@ -754,51 +1168,71 @@ class IRCSession:
         """
         all_books = []
 
-        for txt_file in txt_files:
-            try:
-                print(f"[IRC] Processing text file: {txt_file}")
-
-                with zip_file.open(txt_file) as f:
-                    # Try multiple encodings like openbooks does
-                    content = None
-                    for encoding in ["utf-8", "latin-1", "cp1252", "ascii"]:
-                        try:
-                            f.seek(0)
-                            content = f.read().decode(encoding)
-                            break
-                        except UnicodeDecodeError:
-                            continue
-
-                    if content is None:
-                        print(f"[IRC] Could not decode {txt_file} with any encoding")
-                        continue
-
-                # Parse lines for book information
-                lines = content.split("\n")
-                books = self._parse_book_lines_enhanced(lines, txt_file)
-
-                if books:
-                    all_books.extend(books)
-                    print(
-                        f"[IRC] Parsed {len(books)} valid book entries from {txt_file}"
-                    )
-                else:
-                    print(f"[IRC] No valid book entries found in {txt_file}")
-
-            except Exception as e:
-                print(f"[IRC] Error parsing {txt_file}: {e}")
-                continue
+        # Inflate and parse the files on worker threads; zlib releases the GIL
+        # while inflating, so one file's parsing overlaps another's inflation
+        if len(txt_files) > 1:
+            parsed = list(
+                _listing_pool.map(
+                    lambda txt_file: self._parse_zip_text_file(zip_file, txt_file),
+                    txt_files,
+                )
+            )
+        else:
+            parsed = [
+                self._parse_zip_text_file(zip_file, txt_file) for txt_file in txt_files
+            ]
+
+        # Report on the whole archive in one write rather than a print per file
+        report = []
+        for txt_file, books in zip(txt_files, parsed):
+            report.append(f"[IRC] Processing text file: {txt_file}")
+            if books:
+                all_books.extend(books)
+                report.append(
+                    f"[IRC] Parsed {len(books)} valid book entries from {txt_file}"
+                )
+            else:
+                report.append(f"[IRC] No valid book entries found in {txt_file}")
 
         if not all_books:
-            print("[IRC] No books found in any text files")
+            report.append("[IRC] No books found in any text files")
+            print("\n".join(report))
             return []
 
-        print(f"[IRC] Total books parsed from all text files: {len(all_books)}")
+        report.append(f"[IRC] Total books parsed from all text files: {len(all_books)}")
+        print("\n".join(report))
 
         # Filter and rank books based on search query with enhanced logic
         filtered_books = self._filter_books_by_query_enhanced(all_books, search_query)
         return filtered_books
 
+    def _parse_zip_text_file(self, zip_file, txt_file: str) -> List[ListingBook]:
+        """Stream one text file from a ZIP archive and parse its book lines."""
+        try:
+            # Lines are decoded as they are inflated, so the file is never held
+            # in memory whole. Most listings are UTF-8 (a BOM is dropped); any
+            # other file is read again as Latin-1, which decodes every byte
+            for encoding in TEXT_FILE_ENCODINGS:
+                try:
+                    # The buffer makes each read inflate a large step of the
+                    # member instead of the decoder's small default reads
+                    with (
+                        zip_file.open(txt_file) as raw,
+                        io.BufferedReader(
+                            raw, buffer_size=TEXT_READ_CHUNK_SIZE
+                        ) as buffered,
+                        io.TextIOWrapper(
+                            buffered, encoding=encoding, newline="\n"
+                        ) as lines,
+                    ):
+                        return self._parse_book_lines_enhanced(lines, txt_file)
+                except UnicodeDecodeError:
+                    continue
+        except Exception as e:
+            print(f"[IRC] Error parsing {txt_file}: {e}")
+
+        return []
+
     def _parse_book_lines(self, lines: List[str]) -> List[Dict]:
         """Parse individual lines to extract book information following the pattern <!server> <author> - <book title>.<extension> <file size>"""
         books = []
@@ -813,7 +1247,7 @@ class IRCSession:
                 if book_info:
                     books.append(book_info)
             except Exception as e:
-                print(f"[IRC] Error parsing line '{line}': {e}")
+                logger.debug("Error parsing line '%s': %s", line, e)
                 continue
 
         return books
@@ -843,14 +1277,13 @@ class IRCSession:
         title_and_rest = remaining[dash_pos + 3 :].strip()
 
         # Find file extension and size
-        # Look for common ebook extensions
-        extensions = ["epub", "mobi", "azw3", "pdf", "txt", "html", "rtf"]
+        # Look for common ebook extensions, lower-casing the text only once
         extension_found = None
         title_end = len(title_and_rest)
+        title_and_rest_lower = title_and_rest.lower()
 
-        for ext in extensions:
-            pattern = f".{ext}"
-            pos = title_and_rest.lower().find(pattern)
+        for ext in BOOK_LINE_EXTENSIONS:
+            pos = title_and_rest_lower.find("." + ext)
             if pos != -1:
                 extension_found = ext
                 title_end = pos
@@ -864,7 +1297,7 @@ class IRCSession:
         # Extract file size (everything after the extension)
         size_part = title_and_rest[title_end:].strip()
         # Remove the extension part and extract size
-        size_match = re.search(r"(\d+(?:\.\d+)?\s*[KMGT]?B)", size_part, re.IGNORECASE)
+        size_match = SIZE_REGEX.search(size_part)
         file_size = size_match.group(1) if size_match else "Unknown"
 
         return {
@@ -874,6 +1307,7 @@ class IRCSession:
             "extension": extension_found,
             "size": file_size,
             "raw_line": line,
+            "author_words": _word_set(author_part.lower()),
         }
 
     def _filter_books_by_query(self, books: List[Dict], search_query: str) -> List[str]:
@@ -882,14 +1316,14 @@ class IRCSession:
             return []
 
         query_lower = search_query.lower()
+        query_words = _word_set(query_lower)
         matched_books = []
 
         for book in books:
-            author_lower = book["author"].lower()
             title_lower = book["title"].lower()
 
             # Check if this is an author search or title search
-            if self._is_author_match(author_lower, query_lower):
+            if self._is_author_match(book["author_words"], query_words):
                 score = self._calculate_author_score(book, query_lower)
                 matched_books.append((book, score, "author"))
             elif self._is_title_match(title_lower, query_lower):
@@ -899,26 +1333,24 @@ class IRCSession:
         if not matched_books:
             return []
 
-        # Sort by score (higher is better)
-        matched_books.sort(key=lambda x: x[1], reverse=True)
+        # Keep the 20 best scores (higher is better) without sorting every match
+        top_books = heapq.nlargest(20, matched_books, key=lambda x: x[1])
 
         # Format results for return
         results = []
-        for book, score, match_type in matched_books[:20]:  # Limit to top 20 results
+        for book, score, match_type in top_books:
             result = f"{book['author']} - {book['title']}.{book['extension']} ({book['size']}) [Score: {score:.2f}, Match: {match_type}]"
             results.append(result)
 
         return results
 
-    def _is_author_match(self, author_name: str, query: str) -> bool:
-        """Check if the query matches an author name (handles reversed names)."""
-        # Split both author and query into words
-        author_words = set(author_name.replace(",", "").split())
-        query_words = set(query.split())
-
+    def _is_author_match(
+        self, author_words: FrozenSet[str], query_words: FrozenSet[str]
+    ) -> bool:
+        """Check if the query words match an author's words (handles reversed names)."""
         # Check for substantial overlap (at least 1 word match for short queries, more for longer)
         min_matches = 1 if len(query_words) <= 2 else 2
-        matches = len(author_words.intersection(query_words))
+        matches = len(author_words & query_words)
 
         return matches >= min_matches
 
@@ -952,9 +1384,7 @@ class IRCSession:
         score += size_score
 
         # Format preference (epub > mobi > others)
-        format_bonus = {"epub": 5.0, "mobi": 3.0, "azw3": 2.0}.get(
-            book["extension"], 0.0
-        )
+        format_bonus = AUTHOR_FORMAT_BONUS.get(book["extension"], 0.0)
         score += format_bonus
 
         return score
@@ -986,9 +1416,7 @@ class IRCSession:
         size_score = self._get_size_score(book["size"])
         score += size_score * 0.5  # Lower weight for title searches
 
-        format_bonus = {"epub": 3.0, "mobi": 2.0, "azw3": 1.0}.get(
-            book["extension"], 0.0
-        )
+        format_bonus = TITLE_FORMAT_BONUS.get(book["extension"], 0.0)
         score += format_bonus
 
         return score
@@ -1000,7 +1428,7 @@ class IRCSession:
 
         try:
             # Extract number and unit
-            match = re.match(r"(\d+(?:\.\d+)?)\s*([KMGT]?B)", size_str.upper())
+            match = SIZE_UNIT_REGEX.match(size_str.upper())
             if not match:
                 return 0.0
 
@@ -1008,32 +1436,26 @@ class IRCSession:
             unit = match.group(2)
 
             # Convert to MB for scoring
-            multipliers = {
-                "B": 0.000001,
-                "KB": 0.001,
-                "MB": 1.0,
-                "GB": 1000.0,
-                "TB": 1000000.0,
-            }
-            size_mb = number * multipliers.get(unit, 1.0)
+            size_mb = number * SIZE_MB_MULTIPLIERS.get(unit, 1.0)
 
             # Score based on size (logarithmic scale to prevent huge files from dominating)
-            import math
-
-            return math.log10(max(size_mb, 0.1)) * 2.0
+            return math.log10(size_mb if size_mb > 0.1 else 0.1) * 2.0
 
         except Exception:
             return 0.0
 
     def _parse_book_lines_enhanced(
-        self, lines: List[str], source_file: str
-    ) -> List[Dict]:
+        self, lines: Iterable[str], source_file: str
+    ) -> List[ListingBook]:
         """
         Enhanced book line parsing following openbooks parseLineV2 patterns.
         Supports multiple line formats and better error recovery.
         """
         books = []
         valid_lines = 0
+        # Bound once; these run for every line of what can be a large listing
+        parse_line = self._parse_single_book_line_enhanced
+        add_book = books.append
 
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
@@ -1041,15 +1463,18 @@ class IRCSession:
                 continue
 
             # Skip comment lines and headers
-            if line.startswith("#") or line.startswith("//") or line.startswith(";"):
+            if line.startswith(("#", "//", ";")):
+                continue
+
+            # Every listing format has an "author - title.ext" part, so lines
+            # without both characters can skip the regex entirely
+            if "-" not in line or "." not in line:
                 continue
 
             try:
-                book_info = self._parse_single_book_line_enhanced(
-                    line, source_file, line_num
-                )
+                book_info = parse_line(line, source_file)
                 if book_info:
-                    books.append(book_info)
+                    add_book(book_info)
                     valid_lines += 1
             except Exception as e:
                 # Log parsing errors but continue processing
@@ -1057,14 +1482,11 @@ class IRCSession:
                     print(f"[IRC] Parse error in {source_file}:{line_num}: {e}")
                 continue
 
-        print(
-            f"[IRC] Parsed {len(books)} valid books from {valid_lines} lines in {source_file}"
-        )
         return books
 
     def _parse_single_book_line_enhanced(
-        self, line: str, source_file: str, line_num: int
-    ) -> Optional[Dict]:
+        self, line: str, source_file: str
+    ) -> Optional[ListingBook]:
         """
         Enhanced single line parsing following openbooks parseLineV2 patterns.
         Supports multiple formats:
@@ -1076,65 +1498,52 @@ class IRCSession:
         original_line = line
 
         # Try different line formats
-        patterns = [
-            # openbooks v2 format: !server author - title.ext ::INFO:: size
-            r"^!([^>]+)\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+::INFO::\s+(.+)$",
-            # openbooks v1 format: !server author - title.ext size
-            r"^!([^>]+)\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+(.+)$",
-            # Alternative format: <!server> author - title.ext size
-            r"^<!([^>]+)>\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+(.+)$",
-            # Simple format: server author - title.ext size
-            r"^([^!\s]+)\s+(.+?)\s+-\s+(.+?)\.([a-zA-Z0-9]+)\s+(.+)$",
-        ]
-
-        for pattern in patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                server, author, title, extension, size_info = match.groups()
-
-                # Clean up the extracted data
-                server = server.strip()
-                author = author.strip()
-                title = title.strip()
-                extension = extension.lower().strip()
-
-                # Extract just the size from size_info (may contain additional info)
-                size = self._extract_size_from_info(size_info)
-
-                # Validate ebook extension
-                if not self._is_valid_ebook_extension(extension):
-                    continue
+        for server, author, title, extension, size_info in _match_book_line(line):
+            # Clean up the extracted data
+            server = server.strip()
+            author = author.strip()
+            title = title.strip()
+            extension = extension.lower().strip()
+
+            # Validate ebook extension (already lower-cased)
+            if extension not in EBOOK_EXTENSIONS:
+                continue
 
-                # Validate minimum data quality
-                if len(author) < 2 or len(title) < 2:
-                    continue
+            # Validate minimum data quality
+            if len(author) < 2 or len(title) < 2:
+                continue
 
-                return {
-                    "server": server,
-                    "author": author,
-                    "title": title,
-                    "extension": extension,
-                    "size": size,
-                    "raw_line": original_line,
-                    "source_file": source_file,
-                    "line_number": line_num,
-                    "full_command": f"!{server} {author} - {title}.{extension}",
-                }
+            # Extract just the size from size_info (may contain additional info)
+            size = self._extract_size_from_info(size_info)
+
+            author_lower = author.lower()
+            title_lower = title.lower()
+            # A listing has thousands of lines from a handful of bots and
+            # formats, so every book shares one string for each
+            return ListingBook(
+                server=sys.intern(server),
+                author=author,
+                title=title,
+                author_lower=author_lower,
+                title_lower=title_lower,
+                extension=sys.intern(extension),
+                size=size,
+                size_mb=self._parse_size_to_mb(size) if size != "Unknown" else 0.0,
+                raw_line=original_line,
+                source_file=source_file,
+                full_command=f"!{server} {author} - {title}.{extension}",
+                author_words=_word_set(author_lower),
+                title_words=_word_set(title_lower),
+                version_score=self._get_version_score(title_lower),
+            )
 
         # If no pattern matched, return None (not an error)
         return None
 
     def _extract_size_from_info(self, size_info: str) -> str:
         """Extract file size from info string, handling various formats."""
-        # Common size patterns
-        size_patterns = [
-            r"(\d+(?:\.\d+)?\s*[KMGT]?B)",  # Standard: 1.2MB, 500KB, etc.
-            r"(\d+(?:\.\d+)?\s*[KMGT])",  # Without B: 1.2M, 500K
-            r"(\d+(?:,\d+)*\s*bytes?)",  # Bytes: 1,234,567 bytes
-        ]
-
-        for pattern in size_patterns:
-            match = re.search(pattern, size_info, re.IGNORECASE)
+        for pattern in SIZE_INFO_PATTERNS:
+            match = pattern.search(size_info)
             if match:
                 return match.group(1)
 
@@ -1143,28 +1552,10 @@ class IRCSession:
 
     def _is_valid_ebook_extension(self, extension: str) -> bool:
         """Check if the extension is a valid ebook format."""
-        valid_extensions = {
-            "epub",
-            "mobi",
-            "azw",
-            "azw3",
-            "pdf",
-            "txt",
-            "html",
-            "htm",
-            "rtf",
-            "doc",
-            "docx",
-            "lit",
-            "pdb",
-            "fb2",
-            "djvu",
-            "chm",
-        }
-        return extension.lower() in valid_extensions
+        return extension.lower() in EBOOK_EXTENSIONS
 
     def _filter_books_by_query_enhanced(
-        self, books: List[Dict], search_query: str
+        self, books: List[ListingBook], search_query: str
     ) -> List[str]:
         """
         Enhanced filtering following openbooks intelligent search patterns.
@@ -1174,56 +1565,77 @@ class IRCSession:
             return [self._format_book_result(book) for book in books[:20]]
 
         query_lower = search_query.lower().strip()
-        matched_books = []
+        query_words = _word_set(query_lower)
+
+        # Matches are kept in parallel lists, with the match types as a bit
+        # mask, so each hit doesn't allocate a tuple and a list
+        matched_books: List[ListingBook] = []
+        matched_scores: List[float] = []
+        matched_flags: List[int] = []
 
         # Determine if this is primarily an author search or title search
         search_type = self._determine_search_type(query_lower)
+        # Boost author matches for author searches, title matches for title ones
+        if search_type == "author":
+            boost_flag, boost = MATCH_AUTHOR, 1.5
+        else:
+            boost_flag, boost = MATCH_TITLE, 1.3
+
+        # Look the scoring helpers up once rather than once per book
+        author_match_score = self._calculate_author_match_score
+        title_match_score = self._calculate_title_match_score
+        size_score = self._get_enhanced_size_score
+        format_score = self._get_format_preference_score
 
         for book in books:
             score = 0.0
-            match_types = []
+            flags = 0
 
             # Author matching
-            author_score = self._calculate_author_match_score(
-                book["author"], query_lower
+            author_score = author_match_score(
+                book.author_lower, query_lower, book.author_words, query_words
             )
             if author_score > 0:
                 score += author_score
-                match_types.append("author")
+                flags |= MATCH_AUTHOR
 
             # Title matching
-            title_score = self._calculate_title_match_score(book["title"], query_lower)
+            title_score = title_match_score(
+                book.title_lower, query_lower, book.title_words, query_words
+            )
             if title_score > 0:
                 score += title_score
-                match_types.append("title")
+                flags |= MATCH_TITLE
 
             # Only include books with some match
             if score > 0:
                 # Apply search type weighting
-                if search_type == "author" and "author" in match_types:
-                    score *= 1.5  # Boost author matches for author searches
-                elif search_type == "title" and "title" in match_types:
-                    score *= 1.3  # Boost title matches for title searches
+                if flags & boost_flag:
+                    score *= boost
 
                 # Apply additional scoring factors
-                score += self._get_version_score(book["title"])
-                score += self._get_enhanced_size_score(book["size"])
-                score += self._get_format_preference_score(book["extension"])
+                score += book.version_score
+                score += size_score(book.size_mb)
+                score += format_score(book.extension)
 
-                matched_books.append((book, score, match_types))
+                matched_books.append(book)
+                matched_scores.append(score)
+                matched_flags.append(flags)
 
         if not matched_books:
             print(f"[IRC] No books matched query: {search_query}")
             return []
 
-        # Sort by score (descending)
-        matched_books.sort(key=lambda x: x[1], reverse=True)
+        # Take the top 30 by score (descending); ties keep their listing order
+        top_indices = heapq.nlargest(
+            30, range(len(matched_scores)), key=matched_scores.__getitem__
+        )
 
-        # Format and return results (limit to top 30)
+        # Format and return results
         results = []
-        for book, score, match_types in matched_books[:30]:
+        for i in top_indices:
             formatted_result = self._format_enhanced_book_result(
-                book, score, match_types
+                matched_books[i], matched_scores[i], matched_flags[i]
             )
             results.append(formatted_result)
 
@@ -1233,11 +1645,12 @@ class IRCSession:
     def _determine_search_type(self, query: str) -> str:
         """Determine if query is primarily for author or title search."""
         # Look for patterns that suggest author search
-        author_indicators = ["by ", "author:", "written by", ".", ","]
-        title_indicators = ["the ", "a ", "an ", "book:", "title:"]
-
-        author_score = sum(1 for indicator in author_indicators if indicator in query)
-        title_score = sum(1 for indicator in title_indicators if indicator in query)
+        author_score = sum(
+            1 for indicator in AUTHOR_QUERY_INDICATORS if indicator in query
+        )
+        title_score = sum(
+            1 for indicator in TITLE_QUERY_INDICATORS if indicator in query
+        )
 
         if author_score > title_score:
             return "author"
@@ -1247,9 +1660,14 @@ class IRCSession:
             # Default heuristic: if query has fewer than 3 words, likely author
             return "author" if len(query.split()) <= 2 else "title"
 
-    def _calculate_author_match_score(self, author: str, query: str) -> float:
-        """Calculate how well the author matches the query."""
-        author_lower = author.lower()
+    def _calculate_author_match_score(
+        self,
+        author_lower: str,
+        query: str,
+        author_words: FrozenSet[str],
+        query_words: FrozenSet[str],
+    ) -> float:
+        """Calculate how well the lower-cased author matches the query."""
         score = 0.0
 
         # Exact match (highest score)
@@ -1260,11 +1678,8 @@ class IRCSession:
             score += 80.0
         # Partial word matching
         else:
-            author_words = set(author_lower.replace(",", "").split())
-            query_words = set(query.split())
-
             # Calculate word overlap
-            matches = author_words.intersection(query_words)
+            matches = author_words & query_words
             if matches:
                 # Score based on proportion of query words matched
                 match_ratio = len(matches) / len(query_words)
@@ -1272,9 +1687,14 @@ class IRCSession:
 
         return score
 
-    def _calculate_title_match_score(self, title: str, query: str) -> float:
-        """Calculate how well the title matches the query."""
-        title_lower = title.lower()
+    def _calculate_title_match_score(
+        self,
+        title_lower: str,
+        query: str,
+        title_words: FrozenSet[str],
+        query_words: FrozenSet[str],
+    ) -> float:
+        """Calculate how well the lower-cased title matches the query."""
         score = 0.0
 
         # Exact match
@@ -1285,74 +1705,59 @@ class IRCSession:
             score += 70.0
         # Word-based matching
         else:
-            title_words = set(title_lower.split())
-            query_words = set(query.split())
-
-            matches = title_words.intersection(query_words)
+            matches = title_words & query_words
             if matches:
                 match_ratio = len(matches) / len(query_words)
                 score += match_ratio * 50.0
 
         return score
 
-    def _get_version_score(self, title: str) -> float:
-        """Score books based on version indicators (v5 > v4 > v3 etc)."""
-        title_lower = title.lower()
-
-        # Version priority scoring (openbooks pattern)
-        if "v5" in title_lower or "version 5" in title_lower:
-            return 50.0
-        elif "v4" in title_lower or "version 4" in title_lower:
-            return 30.0
-        elif "v3" in title_lower or "version 3" in title_lower:
-            return 20.0
-        elif "v2" in title_lower or "version 2" in title_lower:
-            return 10.0
-        elif "v1" in title_lower or "version 1" in title_lower:
-            return 5.0
+    def _get_version_score(self, title_lower: str) -> float:
+        """Score a lower-cased title by version indicators (v5 > v4 > v3 etc)."""
+        # Version priority scoring (openbooks pattern); every version marker
+        # contains a "v", so titles without one skip the ten searches
+        if "v" in title_lower:
+            if "v5" in title_lower or "version 5" in title_lower:
+                return 50.0
+            elif "v4" in title_lower or "version 4" in title_lower:
+                return 30.0
+            elif "v3" in title_lower or "version 3" in title_lower:
+                return 20.0
+            elif "v2" in title_lower or "version 2" in title_lower:
+                return 10.0
+            elif "v1" in title_lower or "version 1" in title_lower:
+                return 5.0
 
         # Bonus for other quality indicators
-        quality_indicators = ["retail", "final", "complete", "unabridged", "original"]
-        for indicator in quality_indicators:
+        for indicator in QUALITY_INDICATORS:
             if indicator in title_lower:
                 return 15.0
 
         return 0.0
 
-    def _get_enhanced_size_score(self, size_str: str) -> float:
-        """Enhanced size scoring with better parsing."""
-        if not size_str or size_str == "Unknown":
+    def _get_enhanced_size_score(self, size_mb: float) -> float:
+        """Enhanced size scoring from a size already parsed to MB."""
+        if size_mb <= 0:
             return 0.0
 
-        try:
-            # Parse size more robustly
-            size_mb = self._parse_size_to_mb(size_str)
-            if size_mb <= 0:
-                return 0.0
-
-            # Logarithmic scoring to prevent huge files from dominating
-            import math
+        # Logarithmic scoring to prevent huge files from dominating
+        base_score = math.log10(size_mb if size_mb > 0.1 else 0.1) * 3.0
 
-            base_score = math.log10(max(size_mb, 0.1)) * 3.0
+        # Prefer reasonable ebook sizes (0.5MB - 50MB)
+        if 0.5 <= size_mb <= 50:
+            base_score += 5.0
+        elif size_mb > 50:
+            base_score -= 2.0  # Penalty for very large files
 
-            # Prefer reasonable ebook sizes (0.5MB - 50MB)
-            if 0.5 <= size_mb <= 50:
-                base_score += 5.0
-            elif size_mb > 50:
-                base_score -= 2.0  # Penalty for very large files
-
-            return max(base_score, 0.0)
-
-        except Exception:
-            return 0.0
+        return max(base_score, 0.0)
 
     def _parse_size_to_mb(self, size_str: str) -> float:
         """Parse size string to MB value."""
         # Clean the size string
-        size_clean = re.sub(r"[,\s]+", "", size_str.upper())
+        size_clean = SIZE_CLEAN_REGEX.sub("", size_str.upper())
 
         # Extract number and unit
-        match = re.match(r"(\d+(?:\.\d+)?)([KMGT]?B?)", size_clean)
+        match = SIZE_MB_REGEX.match(size_clean)
         if not match:
             return 0.0
 
@@ -1360,65 +1765,54 @@ class IRCSession:
         unit = match.group(2) or "B"
 
         # Convert to MB
-        multipliers = {
-            "B": 0.000001,
-            "KB": 0.001,
-            "K": 0.001,
-            "MB": 1.0,
-            "M": 1.0,
-            "GB": 1000.0,
-            "G": 1000.0,
-            "TB": 1000000.0,
-            "T": 1000000.0,
-        }
-
-        return number * multipliers.get(unit, 1.0)
+        return number * SIZE_MB_MULTIPLIERS.get(unit, 1.0)
 
     def _get_format_preference_score(self, extension: str) -> float:
         """Score based on format preference (EPUB highest)."""
-        format_scores = {
-            "epub": 15.0,  # Highest preference
-            "mobi": 10.0,
-            "azw3": 8.0,
-            "pdf": 5.0,
-            "html": 3.0,
-            "txt": 2.0,
-            "rtf": 1.0,
-        }
-        return format_scores.get(extension.lower(), 0.0)
+        # Parsed books already carry a lower-case extension
+        return FORMAT_PREFERENCE_SCORES.get(extension, 0.0)
 
     def _format_enhanced_book_result(
-        self, book: Dict, score: float, match_types: List[str]
+        self, book: ListingBook, score: float, match_flags: int
     ) -> str:
         """Format book result with enhanced information."""
-        match_info = "+".join(match_types) if match_types else "general"
+        match_info = MATCH_LABELS[match_flags]
         return (
-            f"{book['author']} - {book['title']}.{book['extension']} "
-            f"({book['size']}) [{book['server']}] "
+            f"{book.author} - {book.title}.{book.extension} "
+            f"({book.size}) [{book.server}] "
             f"[Score: {score:.1f}, Match: {match_info}]"
         )
 
-    def _format_book_result(self, book: Dict) -> str:
+    def _format_book_result(self, book: ListingBook) -> str:
         """Simple book result formatting."""
         return (
-            f"{book['author']} - {book['title']}.{book['extension']} "
-            f"({book['size']}) [{book['server']}]"
+            f"{book.author} - {book.title}.{book.extension} "
+            f"({book.size}) [{book.server}]"
         )
 
     def disconnect(self) -> None:
         """Disconnect from IRC server."""
-        if self.socket:
+        if self._writer:
             try:
-                self.socket.send(b"QUIT :Goodbye\r\n")
-                self.socket.close()
+                _run_coroutine(self._disconnect())
             except Exception:
                 pass
             finally:
-                self.socket = None
                 self.connected = False
                 self.joined_channel = False
                 print(f"[IRC] Disconnected from {self.server}")
 
+    async def _disconnect(self) -> None:
+        """Send QUIT, stop the listener and close the connection."""
+        self.connected = False
+        if self._listener_task:
+            self._listener_task.cancel()
+            self._listener_task = None
+        try:
+            await self._send("QUIT :Goodbye\r\n")
+        finally:
+            self._close_connection()
+
     def search_epub_only(self, query: str, max_results: int = 50) -> List[Dict]:
         """Search for books and filter for EPUB format only (openbooks pattern)."""
         # Perform regular search
@@ -1446,6 +1840,7 @@ class IRCSession:
             epub_books = self.search_parser.filter_results(book_details, epub_only=True)
 
             # Convert back to dict format
+            parsed_at = datetime.now().isoformat()
             epub_results = []
             for book in epub_books:
                 epub_results.append(
@@ -1453,11 +1848,11 @@ class IRCSession:
                         "server": book.server,
                         "author": book.author,
                         "title": book.title,
-                        "format": book.format,
+                        "format": sys.intern(book.format),
                         "size": book.size,
                         "download_command": book.full_command,
                         "raw_line": book.raw_line,
-                        "parsed_at": datetime.now().isoformat(),
+                        "parsed_at": parsed_at,
                         "search_query": query,
                     }
                 )
@@ -1594,10 +1989,11 @@ class IRCSession:
         # Filter for exact title matches
         exact_matches = []
         normalized_target = self._normalize_title(title)
+        target_words = frozenset(normalized_target.split())
 
         for result in all_results:
             normalized_result = self._normalize_title(result["title"])
-            if self._is_title_match(normalized_target, normalized_result):
+            if self._is_title_match(normalized_target, normalized_result, target_words):
                 exact_matches.append(result)
 
         if not exact_matches:
@@ -1606,28 +2002,26 @@ class IRCSession:
 
         print(f"[IRC] Found {len(exact_matches)} exact matches for title")
 
-        # Group by server and select best from each
-        server_groups = {}
+        # Keep the best scoring match from each server in one pass, and
+        # reuse those scores for ranking below
+        best_by_server: Dict[str, Tuple[float, Dict]] = {}
         for result in exact_matches:
-            server = result["server"]
-            if server not in server_groups:
-                server_groups[server] = []
-            server_groups[server].append(result)
-
-        # Select best candidate from each server
-        server_candidates = []
-        for server, candidates in server_groups.items():
-            best_candidate = self._select_best_candidate(candidates, "title")
-            if best_candidate:
-                server_candidates.append(best_candidate)
+            score = self._calculate_candidate_score(result, "title")
+            best = best_by_server.get(result["server"])
+            if best is None or score > best[0]:
+                best_by_server[result["server"]] = (score, result)
 
-        # Sort by quality score (v5 first, then size)
-        server_candidates = self._rank_candidates(server_candidates, "title")
+        server_candidates = [result for _, result in best_by_server.values()]
+        scores = {id(result): score for score, result in best_by_server.values()}
 
         print(
             f"[IRC] Title-level search completed. Found {len(server_candidates)} server options"
         )
-        return server_candidates[:max_results]
+
+        # Sort by quality score (v5 first, then size)
+        return self._rank_candidates(
+            server_candidates, "title", top_k=max_results, scores=scores
+        )
 
     def smart_search_and_download(
         self,
@@ -1766,65 +2160,51 @@ class IRCSession:
     def _download_with_timeout(
         self,
         download_command: str,
-        timeout_seconds: int,
+        timeout_seconds: float,
         custom_filename: Optional[str] = None,
     ) -> Dict:
-        """Download file with specific timeout."""
-        import signal
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Download timeout after {timeout_seconds} seconds")
+        """
+        Download file with specific timeout.
 
-        # Set up timeout signal
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout_seconds)
+        The download runs on the shared download pool so the timeout also
+        works outside the main thread. It stops itself at the deadline, even
+        mid-recv, and removes its partial file; waiting a little longer than
+        the timeout only guards against a worker that never returns.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        future = _download_pool.submit(
+            self.download_file, download_command, custom_filename, deadline=deadline
+        )
 
         try:
-            # Perform the download
-            result = self.download_file(download_command, custom_filename)
-            signal.alarm(0)  # Cancel the alarm
-            return result
-
-        except TimeoutError as e:
-            print(f"[IRC] Download timeout: {e}")
-            return {"success": False, "error": str(e)}
+            return future.result(timeout=timeout_seconds + DOWNLOAD_DEADLINE_GRACE)
+        except TimeoutError:
+            error_msg = f"Download timeout after {timeout_seconds} seconds"
+            print(f"[IRC] Download timeout: {error_msg}")
+            return {"success": False, "error": error_msg}
         except Exception as e:
             print(f"[IRC] Download error: {e}")
             return {"success": False, "error": str(e)}
-        finally:
-            # Restore original signal handler
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
 
     def _normalize_title(self, title: str) -> str:
         """Normalize title for comparison by removing common variations."""
         if not title:
             return ""
 
-        normalized = title.lower().strip()
+        return _normalize_title_cached(title)
 
-        # Remove common prefixes/suffixes
-        prefixes_to_remove = ["the ", "a ", "an "]
-        for prefix in prefixes_to_remove:
-            if normalized.startswith(prefix):
-                normalized = normalized[len(prefix) :]
+    def _is_title_match(
+        self,
+        target: str,
+        candidate: str,
+        target_words: Optional[FrozenSet[str]] = None,
+    ) -> bool:
+        """
+        Check if two normalized titles match closely enough.
 
-        # Remove version information and extra content
-        normalized = re.sub(
-            r"\s*\([^)]*\)\s*", " ", normalized
-        )  # Remove parentheses content
-        normalized = re.sub(
-            r"\s*\[[^\]]*\]\s*", " ", normalized
-        )  # Remove brackets content
-        normalized = re.sub(
-            r"\s*v\d+\s*", " ", normalized, re.IGNORECASE
-        )  # Remove version numbers
-        normalized = re.sub(r"\s+", " ", normalized).strip()  # Normalize whitespace
-
-        return normalized
-
-    def _is_title_match(self, target: str, candidate: str) -> bool:
-        """Check if two normalized titles match closely enough."""
+        Callers matching many candidates against one target can pass the
+        target's words so they are only split once.
+        """
         if not target or not candidate:
             return False
 
@@ -1837,10 +2217,22 @@ class IRCSession:
             return True
 
         # Word-based similarity
-        target_words = set(target.split())
-        candidate_words = set(candidate.split())
+        if target_words is None:
+            target_words = frozenset(target.split())
+        if not target_words:
+            return False
 
-        if not target_words or not candidate_words:
+        # Overlap over union can't exceed the ratio of the word counts, so
+        # titles with far fewer or far more words are rejected before any set
+        # math. Normalized titles are single-spaced, so counting spaces gives
+        # an upper bound on the candidate's distinct words.
+        if candidate.count(" ") + 1 < TITLE_MATCH_SIMILARITY * len(target_words):
+            return False
+
+        candidate_words = set(candidate.split())
+        if not candidate_words or len(target_words) < TITLE_MATCH_SIMILARITY * len(
+            candidate_words
+        ):
             return False
 
         # Calculate similarity ratio
@@ -1849,7 +2241,7 @@ class IRCSession:
         similarity = overlap / total_unique if total_unique > 0 else 0
 
         # Consider it a match if similarity is high enough
-        return similarity >= 0.7
+        return similarity >= TITLE_MATCH_SIMILARITY
 
     def _select_best_candidate(
         self, candidates: List[Dict], search_type: str
@@ -1873,9 +2265,11 @@ class IRCSession:
         best_candidate = scored_candidates[0][0]
         best_score = scored_candidates[0][1]
 
-        print(
-            f"[IRC] Selected best candidate: {best_candidate.get('title', 'unknown')} "
-            f"from {best_candidate.get('server', 'unknown')} (score: {best_score:.2f})"
+        logger.debug(
+            "Selected best candidate: %s from %s (score: %.2f)",
+            best_candidate.get("title", "unknown"),
+            best_candidate.get("server", "unknown"),
+            best_score,
         )
 
         return best_candidate
@@ -1887,43 +2281,26 @@ class IRCSession:
         size = candidate.get("size", "")
         format_type = candidate.get("format", "").lower()
 
-        # Version priority (highest priority)
-        if "v5" in title:
-            score += 100.0
-        elif "v4" in title:
-            score += 80.0
-        elif "v3" in title:
-            score += 60.0
-        elif "v2" in title:
-            score += 40.0
-        elif "v1" in title:
-            score += 20.0
+        # Version priority (highest priority): 20 points per version, v5 top
+        version = max(CANDIDATE_VERSION_REGEX.findall(title), default="")
+        if version:
+            score += 20.0 * int(version)
 
         # File size scoring
         size_score = self._parse_size_for_scoring(size)
         score += size_score
 
         # Format preference (EPUB highest)
-        format_scores = {
-            "epub": 30.0,
-            "mobi": 20.0,
-            "azw3": 15.0,
-            "pdf": 10.0,
-            "txt": 5.0,
-        }
-        score += format_scores.get(format_type, 0.0)
+        score += CANDIDATE_FORMAT_SCORES.get(format_type, 0.0)
 
         # Quality indicators
-        quality_keywords = ["retail", "final", "complete", "unabridged", "original"]
-        for keyword in quality_keywords:
-            if keyword in title:
-                score += 25.0
-                break
+        if any(keyword in title for keyword in QUALITY_INDICATORS):
+            score += 25.0
 
         # Bonus for specific search types
         if search_type == "author":
             # For author searches, prefer newer versions more
-            if "v5" in title:
+            if version == "5":
                 score += 50.0
         elif search_type == "title":
             # For title searches, prefer larger files (more complete)
@@ -1936,79 +2313,57 @@ class IRCSession:
         if not size_str:
             return 0.0
 
-        try:
-            # Extract number and unit
-            match = re.match(r"(\d+(?:\.\d+)?)\s*([KMGT]?B?)", size_str.upper())
-            if not match:
-                return 0.0
-
-            number = float(match.group(1))
-            unit = match.group(2) or "B"
-
-            # Convert to MB for scoring
-            multipliers = {
-                "B": 0.000001,
-                "KB": 0.001,
-                "K": 0.001,
-                "MB": 1.0,
-                "M": 1.0,
-                "GB": 1000.0,
-                "G": 1000.0,
-                "TB": 1000000.0,
-                "T": 1000000.0,
-            }
-
-            size_mb = number * multipliers.get(unit, 1.0)
-
-            # Logarithmic scoring with reasonable ebook size preference
-            import math
-
-            base_score = math.log10(max(size_mb, 0.1)) * 10.0
-
-            # Bonus for reasonable ebook sizes (0.5MB - 50MB)
-            if 0.5 <= size_mb <= 50:
-                base_score += 20.0
-            elif size_mb > 100:
-                base_score -= 10.0  # Penalty for very large files
-
-            return max(base_score, 0.0)
+        return _size_scoring_value(size_str)
 
-        except Exception:
-            return 0.0
+    def _rank_candidates(
+        self,
+        candidates: List[Dict],
+        search_type: str,
+        top_k: Optional[int] = None,
+        scores: Optional[Dict[int, float]] = None,
+    ) -> List[Dict]:
+        """
+        Rank candidates by quality score, keeping the best top_k if given.
 
-    def _rank_candidates(self, candidates: List[Dict], search_type: str) -> List[Dict]:
-        """Rank candidates by quality score."""
+        scores maps id(candidate) to a score the caller already computed;
+        candidates missing from it are scored here, once each.
+        """
         if not candidates:
             return []
 
-        scored_candidates = []
+        scores = dict(scores) if scores else {}
         for candidate in candidates:
-            score = self._calculate_candidate_score(candidate, search_type)
-            scored_candidates.append((candidate, score))
+            if id(candidate) not in scores:
+                scores[id(candidate)] = self._calculate_candidate_score(
+                    candidate, search_type
+                )
 
-        # Sort by score (highest first)
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+        def score(candidate: Dict) -> float:
+            return scores[id(candidate)]
 
-        # Return just the candidates in ranked order
-        return [candidate for candidate, score in scored_candidates]
+        # Only the best few are needed, so skip sorting the whole list
+        if top_k is not None and top_k < len(candidates) // 2:
+            return heapq.nlargest(top_k, candidates, key=score)
+
+        # Sort by score (highest first)
+        return sorted(candidates, key=score, reverse=True)[:top_k]
 
 
-# Global session manager
+# Global session manager. Single dict reads, stores and pops are atomic, so
+# no lock is taken; iteration works on a snapshot.
 _active_sessions: Dict[str, IRCSession] = {}
-_sessions_lock = threading.RLock()
 
 
 def create_irc_session() -> str:
     """Create a new IRC session and return session ID."""
     session = IRCSession()
 
-    with _sessions_lock:
-        _active_sessions[session.session_id] = session
+    _active_sessions[session.session_id] = session
 
-    # Connect in background
-    def connect_session():
+    # Connect in background on the shared event loop
+    async def connect_session():
         try:
-            if session.connect():
+            if await session._connect():
                 print(f"[IRC] Session {session.session_id} connected successfully")
             else:
                 print(f"[IRC] Session {session.session_id} failed to connect")
@@ -2017,26 +2372,23 @@ def create_irc_session() -> str:
             print(f"[IRC] Session {session.session_id} connection error: {e}")
             session._update_status({"errors": [f"Connection failed: {str(e)}"]})
 
-    thread = threading.Thread(target=connect_session, daemon=True)
-    thread.start()
+    asyncio.run_coroutine_threadsafe(connect_session(), _get_event_loop())
 
     return session.session_id
 
 
 def get_session(session_id: str) -> Optional[IRCSession]:
     """Get an active IRC session."""
-    with _sessions_lock:
-        return _active_sessions.get(session_id)
+    return _active_sessions.get(session_id)
 
 
 def close_session(session_id: str) -> bool:
     """Close an IRC session."""
-    with _sessions_lock:
-        session = _active_sessions.pop(session_id, None)
-        if session:
-            session.disconnect()
-            return True
-        return False
+    session = _active_sessions.pop(session_id, None)
+    if session:
+        session.disconnect()
+        return True
+    return False
 
 
 def search_and_download(
@@ -2091,11 +2443,10 @@ def get_session_status(session_id: str) -> Dict:
 
 def list_active_sessions() -> List[Dict]:
     """List all active IRC sessions."""
-    with _sessions_lock:
-        sessions = []
-        for session_id, session in _active_sessions.items():
-            sessions.append({"session_id": session_id, "status": session.get_status()})
-        return sessions
+    sessions = []
+    for session_id, session in list(_active_sessions.items()):
+        sessions.append({"session_id": session_id, "status": session.get_status()})
+    return sessions
 
 
 def search_epub_only(session_id: str, search_query: str, max_results: int = 50) -> Dict:
@@ -57,6 +57,9 @@ class SearchResultParser:
     # Archive extensions (should be last)
     ARCHIVE_EXTENSIONS = ["rar", "zip"]
 
+    # Set form of FILE_TYPES for the per-line extension check
+    _EXT_SET = frozenset(FILE_TYPES)
+
     def __init__(self):
         self.results: List[BookDetail] = []
         self.errors: List[ParseError] = []
@@ -131,8 +134,16 @@ class SearchResultParser:
         if not line.startswith("!"):
             return False
 
-        line_lower = line.lower()
-        return any(f".{ext}" in line_lower for ext in self.FILE_TYPES)
+        # Compare the text after each dot against the known extensions
+        dot = line.find(".")
+        while dot != -1:
+            if (
+                line[dot + 1 : dot + 4].lower() in self._EXT_SET
+                or line[dot + 1 : dot + 5].lower() in self._EXT_SET
+            ):
+                return True
+            dot = line.find(".", dot + 1)
+        return False
 
     def _parse_info_format(self, line: str) -> Optional[BookDetail]:
         """
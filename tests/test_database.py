@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Test suite for database service functionality
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def create_calibre_db(path, books):
+    """Create a minimal Calibre metadata.db with (author, title) books."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT);
+        CREATE TABLE authors (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+        CREATE TABLE books_authors_link (id INTEGER PRIMARY KEY, book INTEGER, author INTEGER);
+    """)
+    for author, title in books:
+        conn.execute("INSERT OR IGNORE INTO authors (name) VALUES (?)", (author,))
+        author_id = conn.execute(
+            "SELECT id FROM authors WHERE name = ?", (author,)
+        ).fetchone()[0]
+        book_id = conn.execute(
+            "INSERT INTO books (title) VALUES (?)", (title,)
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO books_authors_link (book, author) VALUES (?, ?)",
+            (book_id, author_id),
+        )
+    conn.commit()
+    conn.close()
+
+
+class TestDatabaseService:
+    """Test class for database service functionality."""
+
+    def setup_method(self):
+        """Set up a Calibre library and an initialized application database."""
+        from app.services.database import initialize_database
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.calibre_db = os.path.join(self.temp_dir, "metadata.db")
+        self.db_path = os.path.join(self.temp_dir, "data", "authors_books.db")
+
+        create_calibre_db(
+            self.calibre_db,
+            [
+                ("Author A", "Book 1"),
+                ("Author A", "Book 2"),
+                ("Author A", "Book 3"),
+                ("Author B", "Book 4"),
+            ],
+        )
+        result = initialize_database(self.db_path, self.calibre_db)
+        assert result["success"]
+
+    def teardown_method(self):
+        """Remove temporary databases."""
+        from app.services.database import connection_pool
+
+        connection_pool.close_all(self.db_path)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_initialize_database(self):
+        """Test that initialization imports all Calibre records."""
+        from app.services.database import get_database_stats
+
+        stats = get_database_stats(self.db_path)
+        assert stats == {"authors": 2, "total_books": 4, "missing_books": 0}
+
+    def test_author_summary_tracks_changes(self):
+        """Test that popular authors reflect inserts and missing updates."""
+        from app.services.database import get_popular_authors, update_missing_books
+
+        update_missing_books(self.db_path, "Author A", ["Book 2"])
+
+        authors = get_popular_authors(self.db_path)
+        assert [a["name"] for a in authors] == ["Author A", "Author B"]
+        assert authors[0]["total_books"] == 3
+        assert authors[0]["missing_books"] == 1
+
+    def test_store_author_olids_bulk(self):
+        """Test storing OLIDs for several authors at once."""
+        from app.services.database import (
+            get_author_olid,
+            get_author_olid_from_books,
+            get_authors_without_olid,
+            store_author_olids_bulk,
+        )
+
+        store_author_olids_bulk(self.db_path, {"Author A": "OL1A", "Author B": None})
+
+        assert get_author_olid_from_books(self.db_path, "Author A") == "OL1A"
+        assert get_author_olid(self.db_path, "Author A") == "OL1A"
+        assert get_author_olid(self.db_path, "Author B") is None
+        assert get_authors_without_olid(self.db_path) == [
+            {"author": "Author B", "book_count": 1}
+        ]
+
+    def test_get_dashboard(self):
+        """Test that the dashboard combines stats and author lists."""
+        from app.services.database import get_dashboard, update_author_processing_time
+
+        update_author_processing_time(self.db_path, "Author B")
+
+        dashboard = get_dashboard(self.db_path, limit=1)
+        assert dashboard["stats"]["total_books"] == 4
+        assert [a["name"] for a in dashboard["popular_authors"]] == ["Author A"]
+        assert [a["name"] for a in dashboard["recent_authors"]] == ["Author B"]
+
+    def test_connection_pool_reuses_connections(self):
+        """Test that released connections are handed out again."""
+        from app.services.database import ConnectionPool
+
+        pool = ConnectionPool(max_connections=1)
+        with pool.connection(self.db_path) as conn:
+            first = conn
+        with pool.connection(self.db_path) as conn:
+            assert conn is first
+            # A second concurrent checkout gets its own connection
+            with pool.connection(self.db_path) as other:
+                assert other is not first
+
+        pool.close_all()
+
+    def test_missing_books_by_author_cache_invalidation(self):
+        """Test that cached missing books refresh after the database changes."""
+        from app.services.database import (
+            get_missing_books_by_author,
+            ignore_book,
+            store_missing_books,
+        )
+
+        store_missing_books(self.db_path, "Author A", ["Lost Book"])
+        assert [
+            b["title"] for b in get_missing_books_by_author(self.db_path, "Author A")
+        ] == ["Lost Book"]
+
+        store_missing_books(self.db_path, "Author A", ["Another Book"])
+        assert len(get_missing_books_by_author(self.db_path, "Author A")) == 2
+
+        ignore_book(self.db_path, "Author A", "Lost Book")
+        assert [
+            b["title"] for b in get_missing_books_by_author(self.db_path, "Author A")
+        ] == ["Another Book"]
+
+    def test_are_books_ignored(self):
+        """Test batched ignored-book lookups."""
+        from app.services.database import (
+            are_books_ignored,
+            ignore_book,
+            is_book_ignored,
+        )
+
+        ignore_book(self.db_path, "Author A", "Book 1")
+
+        assert is_book_ignored(self.db_path, "Author A", "Book 1")
+        assert not is_book_ignored(self.db_path, "Author A", "Book 2")
+        assert are_books_ignored(
+            self.db_path, [("Author A", "Book 1"), ("Author A", "Book 2")]
+        ) == {("Author A", "Book 1")}
+
+    def test_walk_for_metadata_db_skips_heavy_dirs(self):
+        """Test that the home directory walk skips caches and respects depth."""
+        from pathlib import Path
+
+        from app.services.database import SCAN_MAX_DEPTH, _walk_for_metadata_db
+
+        root = Path(self.temp_dir) / "home"
+        for rel in ["Books", ".cache/lib", "node_modules/lib", "a/b/c/d/e/f/g"]:
+            (root / rel).mkdir(parents=True)
+            (root / rel / "metadata.db").touch()
+
+        found = list(_walk_for_metadata_db(root))
+        assert found == [str(root / "Books" / "metadata.db")]
+        assert SCAN_MAX_DEPTH < 7
+
+    def test_get_all_missing_books_pagination(self):
+        """Test limit and keyset pagination of missing books."""
+        from app.services.database import get_all_missing_books, store_missing_books
+
+        store_missing_books(self.db_path, "Author A", ["Lost 1", "Lost 2", "Lost 3"])
+
+        first_page = get_all_missing_books(self.db_path, limit=2)
+        assert len(first_page) == 2
+
+        last = first_page[-1]
+        second_page = get_all_missing_books(
+            self.db_path,
+            limit=2,
+            after_discovered_at=last["discovered_at"],
+            after_rowid=last["id"],
+        )
+        titles = [b["title"] for b in first_page + second_page]
+        assert sorted(titles) == ["Lost 1", "Lost 2", "Lost 3"]
+
+    def test_ignore_books_bulk(self):
+        """Test ignoring several books in one call."""
+        from app.services.database import (
+            get_all_missing_books,
+            get_ignored_books,
+            ignore_books,
+            store_missing_books,
+        )
+
+        store_missing_books(self.db_path, "Author A", ["Lost 1", "Lost 2"])
+
+        assert ignore_books(
+            self.db_path, [("Author A", "Lost 1"), ("Author B", "Book 4")]
+        )
+        assert [b["title"] for b in get_all_missing_books(self.db_path)] == ["Lost 2"]
+        assert len(get_ignored_books(self.db_path)) == 2
+
+    def test_connection_pool_readonly_connections(self):
+        """Test that reader connections see data but refuse writes."""
+        from app.services.database import ConnectionPool
+
+        pool = ConnectionPool()
+        with pool.connection(self.db_path, readonly=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM author_book").fetchone()[0] == 4
+            try:
+                conn.execute("DELETE FROM author_book")
+                assert False, "write on a read-only connection should fail"
+            except sqlite3.OperationalError:
+                pass
+
+        with pool.connection(self.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM author_book").fetchone()[0] == 4
+
+        pool.close_all(self.db_path)
+
+    def test_ignored_flag_hides_missing_books(self):
+        """Test that the ignored flag follows ignored_books via triggers."""
+        from app.services.database import (
+            get_all_missing_books,
+            ignore_book,
+            store_missing_books,
+            unignore_book,
+        )
+
+        ignore_book(self.db_path, "Author A", "Lost 1")
+        store_missing_books(self.db_path, "Author A", ["Lost 1", "Lost 2"])
+        assert [b["title"] for b in get_all_missing_books(self.db_path)] == ["Lost 2"]
+
+        unignore_book(self.db_path, "Author A", "Lost 1")
+        titles = [b["title"] for b in get_all_missing_books(self.db_path)]
+        assert sorted(titles) == ["Lost 1", "Lost 2"]
+
+    def test_force_reinit_removes_wal_files(self):
+        """Test that re-initialization doesn't leave a stale WAL behind."""
+        from unittest.mock import patch
+
+        from app.services.database import get_database_stats, initialize_database
+
+        for suffix in ("-wal", "-shm"):
+            with open(self.db_path + suffix, "ab") as f:
+                f.write(b"stale")
+
+        with patch("app.services.database.os.remove", wraps=os.remove) as remove:
+            result = initialize_database(
+                self.db_path, self.calibre_db, force_reinit=True
+            )
+
+        assert result["success"]
+        removed = [call.args[0] for call in remove.call_args_list]
+        assert self.db_path + "-wal" in removed
+        assert self.db_path + "-shm" in removed
+        assert get_database_stats(self.db_path)["total_books"] == 4
+
+    def test_failed_import_leaves_no_partial_library(self):
+        """Test that an import failing part way is retried on the next start."""
+        from unittest.mock import patch
+
+        from app.services.database import get_database_stats, initialize_database
+
+        db_path = os.path.join(self.temp_dir, "data", "retry.db")
+        with patch(
+            "app.services.database.create_indexes", side_effect=RuntimeError("boom")
+        ):
+            result = initialize_database(db_path, self.calibre_db)
+        assert not result["success"]
+
+        # Nothing from the failed import was kept
+        conn = sqlite3.connect(db_path)
+        tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'author_book'"
+        ).fetchall()
+        conn.close()
+        assert tables == []
+
+        result = initialize_database(db_path, self.calibre_db)
+        assert result["success"]
+        assert result["records_imported"] == 4
+        assert get_database_stats(db_path)["total_books"] == 4
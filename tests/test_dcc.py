@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Test suite for DCC protocol handling
+"""
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+from unittest.mock import patch
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def start_dcc_sender(payload, stall=None):
+    """Start a one-shot DCC sender that serves payload and return its port."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def send_payload():
+        conn, _ = server.accept()
+        try:
+            conn.sendall(payload)
+            if stall is not None:
+                stall.wait(5)
+        except OSError:
+            pass
+        finally:
+            conn.close()
+            server.close()
+
+    threading.Thread(target=send_payload, daemon=True).start()
+    return server.getsockname()[1]
+
+
+class TestDCCHandler:
+    """Test class for DCC message parsing."""
+
+    def test_int_to_ip(self):
+        """Test conversion of 32-bit integers to dotted decimal."""
+        from app.services.dcc import DCCHandler
+
+        assert DCCHandler._int_to_ip(1543751478) == "92.3.199.54"
+        assert DCCHandler._int_to_ip(0) == "0.0.0.0"
+        assert DCCHandler._int_to_ip(0xFFFFFFFF) == "255.255.255.255"
+        assert DCCHandler._int_to_ip(1 << 32) == "0.0.0.0"
+
+    def test_parse_dcc_string(self):
+        """Test parsing of unquoted and quoted DCC SEND messages."""
+        from app.services.dcc import DCCHandler
+
+        dcc = DCCHandler.parse_dcc_string(
+            ":SearchOok!ook@only.ook PRIVMSG evan_28 :DCC SEND SearchOok_results_for__hp_lovecraft.txt.zip 1543751478 2043 784"
+        )
+        assert dcc.filename == "SearchOok_results_for__hp_lovecraft.txt.zip"
+        assert dcc.ip == "92.3.199.54"
+        assert dcc.size == 784
+
+        dcc = DCCHandler.parse_dcc_string(
+            ':DV8!HandyAndy@host PRIVMSG user :DCC SEND "Douglas Adams - Hitchhiker\'s Guide.epub" 2760158537 2050 2321788'
+        )
+        assert dcc.filename == "Douglas Adams - Hitchhiker's Guide.epub"
+        assert dcc.size == 2321788
+
+        # Numbers inside an unquoted filename stay part of the name
+        dcc = DCCHandler.parse_dcc_string(
+            ":Bot!bot@host PRIVMSG user :\x01DCC SEND Book 1 2 3.epub 2907707975 4342 1116\x01"
+        )
+        assert dcc.filename == "Book 1 2 3.epub"
+        assert dcc.ip == "173.80.26.71"
+        assert dcc.port == 4342
+        assert dcc.size == 1116
+
+    def test_non_dcc_message(self):
+        """Test that ordinary IRC lines are rejected."""
+        from app.services.dcc import DCCHandler
+
+        line = ":server 001 nick :Welcome to the IRC network"
+        assert DCCHandler.parse_dcc_string(line) is None
+        assert not DCCHandler.is_dcc_message(line)
+
+    def test_download_file(self):
+        """Test downloading a file from a local DCC sender."""
+        from app.services.dcc import DCCDownload, DCCHandler
+
+        payload = os.urandom(200 * 1024)
+        port = start_dcc_sender(payload)
+
+        dcc = DCCDownload(
+            filename="book.epub",
+            ip="127.0.0.1",
+            port=port,
+            size=len(payload),
+            raw_line="",
+        )
+        progress = []
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "book.epub")
+            result = DCCHandler.download_file(
+                dcc, output_path, lambda received, total, pct: progress.append(pct)
+            )
+
+            assert result["success"]
+            with open(output_path, "rb") as f:
+                assert f.read() == payload
+
+        assert progress[-1] == 100
+        assert len(progress) <= len(payload) // DCCHandler.CHUNK_SIZE + 1
+
+    def test_download_file_without_preallocation(self):
+        """Test that downloads fall back to write() when space can't be reserved."""
+        from app.services.dcc import DCCDownload, DCCHandler
+
+        payload = os.urandom(200 * 1024 + 17)
+        port = start_dcc_sender(payload)
+
+        dcc = DCCDownload(
+            filename="book.epub",
+            ip="127.0.0.1",
+            port=port,
+            size=len(payload),
+            raw_line="",
+        )
+
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            patch(
+                "app.services.dcc.os.posix_fallocate",
+                side_effect=OSError(28, "No space left on device"),
+                create=True,
+            ),
+            patch("app.services.dcc.mmap.mmap", side_effect=AssertionError),
+        ):
+            output_path = os.path.join(temp_dir, "book.epub")
+            result = DCCHandler.download_file(dcc, output_path)
+
+            assert result["success"]
+            with open(output_path, "rb") as f:
+                assert f.read() == payload
+
+    def test_download_file_incomplete(self):
+        """Test that a short transfer fails and removes the partial file."""
+        from app.services.dcc import DCCDownload, DCCHandler
+
+        payload = os.urandom(1000)
+        port = start_dcc_sender(payload)
+
+        dcc = DCCDownload(
+            filename="book.epub",
+            ip="127.0.0.1",
+            port=port,
+            size=4096,
+            raw_line="",
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "book.epub")
+            result = DCCHandler.download_file(dcc, output_path)
+
+            assert not result["success"]
+            assert result["received"] == len(payload)
+            assert not os.path.exists(output_path)
+
+    def test_download_file_deadline(self):
+        """Test that a stalled sender can't hold a download past its deadline."""
+        import time
+
+        from app.services.dcc import DCCDownload, DCCHandler
+
+        release = threading.Event()
+        port = start_dcc_sender(b"x" * 1000, stall=release)
+
+        dcc = DCCDownload(
+            filename="book.epub",
+            ip="127.0.0.1",
+            port=port,
+            size=10 * 1024 * 1024,
+            raw_line="",
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "book.epub")
+            start = time.monotonic()
+            result = DCCHandler.download_file(dcc, output_path, deadline=start + 0.3)
+
+            assert time.monotonic() - start < 2
+            assert not result["success"]
+            assert not os.path.exists(output_path)
+
+        release.set()
+
+    def test_download_file_aborted(self):
+        """Test that an exception mid-transfer leaves no file behind."""
+        from app.services.dcc import DCCDownload, DCCHandler
+
+        payload = os.urandom(300 * 1024)
+        port = start_dcc_sender(payload)
+
+        dcc = DCCDownload(
+            filename="book.epub",
+            ip="127.0.0.1",
+            port=port,
+            size=10 * 1024 * 1024,
+            raw_line="",
+        )
+
+        def abort(received, total, pct):
+            raise TimeoutError("cancelled")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "book.epub")
+            result = DCCHandler.download_file(dcc, output_path, abort)
+
+            assert not result["success"]
+            assert "cancelled" in result["error"]
+            assert not os.path.exists(output_path)
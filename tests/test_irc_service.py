@@ -3,9 +3,12 @@
 Test suite for IRC service functionality
 """
 
+import asyncio
+import io
 import os
 import sys
 import tempfile
+import threading
 import zipfile
 from unittest.mock import patch
 
@@ -13,6 +16,25 @@ from unittest.mock import patch
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+def start_fake_irc_server(search_lines):
+    """Start a minimal IRC server that answers searches with search_lines."""
+
+    async def handle(reader, writer):
+        while line := await reader.readline():
+            if line.startswith(b"USER"):
+                writer.write(b":srv 001 me :Welcome\r\n:srv 004 me srv\r\n")
+            elif line.startswith(b"JOIN"):
+                writer.write(b":srv 366 me #ebooks :End of /NAMES list\r\n")
+            elif b"@search" in line:
+                writer.write(b"".join(result + b"\r\n" for result in search_lines))
+            await writer.drain()
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(handle, "127.0.0.1", 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
 class TestIRCService:
     """Test class for IRC service functionality."""
 
@@ -137,6 +159,31 @@ class TestIRCService:
                 # Cleanup
                 os.unlink(tmp_zip.name)
 
+    def test_parse_text_files_from_zip_multiple_files(self):
+        """Test that every text file in a search archive is parsed, in order."""
+        from app.services.irc import IRCSession
+
+        session = IRCSession()
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("a.txt", "\ufeff!BotA Jane Doe - First Book.epub 1.2MB\n")
+            # Not UTF-8 past the first line, so it is read again as Latin-1
+            zf.writestr(
+                "b.txt",
+                "!BotB Jane Doe - Second Book.epub 900KB\n"
+                "!BotB Jane Doe - Café Stories.epub 2MB\n".encode("cp1252"),
+            )
+            zf.writestr("c.txt", b"no books here\n")
+
+        with zipfile.ZipFile(buffer) as zf:
+            results = session._parse_text_files_from_zip(
+                zf, ["a.txt", "b.txt", "c.txt"], "Jane Doe"
+            )
+
+        assert len(results) == 3
+        assert any("Café Stories" in result for result in results)
+        assert "Second Book" in results[-1]
+
     @patch("app.services.irc.IRCSession.search_books")
     def test_search_epub_only_method(self, mock_search_books):
         """Test EPUB-only search method."""
@@ -283,3 +330,142 @@ class TestIRCService:
         session._enforce_rate_limit()
         elapsed = time.time() - start_time
         assert elapsed >= 0.9  # Should wait for rate limit
+
+    def test_search_books_over_connection(self):
+        """Test connecting and collecting search results from a live server."""
+        from app.services.irc import IRCSession
+
+        port = start_fake_irc_server(
+            [
+                b"!Bot Test Author - Book One.epub  ::INFO:: 1.2MB",
+                b"!Bot Test Author - Book Two.epub  ::INFO:: 1.5MB",
+            ]
+        )
+
+        session = IRCSession(server="127.0.0.1", port=port, enable_tls=False)
+        session.rate_limit_delay = 0
+        try:
+            assert session.connect()
+            assert session.get_status()["joined_channel"] is True
+
+            results = session.search_books("Test Author", max_results=2)
+            assert [r["title"] for r in results] == ["Book One", "Book Two"]
+        finally:
+            session.disconnect()
+        assert session.connected is False
+
+    def test_listener_reassembles_split_lines(self):
+        """Test that lines split across reads are parsed once complete."""
+        from unittest.mock import Mock
+
+        from app.services.irc import IRCSession
+
+        async def run_listener(session, chunks):
+            session._reader = asyncio.StreamReader()
+            for chunk in chunks:
+                session._reader.feed_data(chunk)
+            session._reader.feed_eof()
+            await session._listener()
+
+        session = IRCSession()
+        session.connected = True
+        session._writer = Mock()
+        session._results_wanted = 10
+
+        asyncio.run(
+            run_listener(
+                session,
+                [b"PING :irc.test\r\n!Bot Author - Bo", b"ok.epub ::INFO:: 1MB\r\n"],
+            )
+        )
+
+        session._writer.write.assert_called_once_with(b"PONG :irc.test\r\n")
+        assert list(session._search_results) == ["!Bot Author - Book.epub ::INFO:: 1MB"]
+        assert session.connected is False
+
+    def test_author_match_ignores_punctuation(self):
+        """Test that word matching ignores punctuation in names and queries."""
+        from app.services.irc import IRCSession, _word_set
+
+        session = IRCSession()
+        author = "tolkien, j.r.r."
+        query = "j.r.r tolkien"
+
+        assert _word_set(author) == {"tolkien", "jrr"}
+        assert (
+            session._calculate_author_match_score(
+                author, query, _word_set(author), _word_set(query)
+            )
+            == 60.0
+        )
+
+    def test_handle_ping(self):
+        """Test that only PING frames are answered, with their token intact."""
+        from unittest.mock import Mock
+
+        from app.services.irc import IRCSession
+
+        session = IRCSession()
+        session._writer = Mock()
+
+        assert not session._handle_ping(b":nick!u@h PRIVMSG #ebooks :PING me")
+        assert session._handle_ping(b"PING :PING.server")
+        session._writer.write.assert_called_once_with(b"PONG :PING.server\r\n")
+
+    def test_process_irc_line_routing(self):
+        """Test that lines reach only the handler their first byte allows."""
+        from unittest.mock import Mock
+
+        from app.services.irc import IRCSession
+
+        session = IRCSession()
+        session._writer = Mock()
+        session._handle_version_request = Mock()
+        session._handle_dcc_offer = Mock()
+
+        session._process_irc_line(b"NOTICE AUTH :DCC SEND is disabled")
+        session._process_irc_line(b":nick!u@h PRIVMSG #ebooks :VERSION please")
+        session._handle_version_request.assert_not_called()
+        session._handle_dcc_offer.assert_not_called()
+
+        session._process_irc_line(b":nick!u@h PRIVMSG me :\x01VERSION\x01")
+        session._process_irc_line(b":bot!u@h PRIVMSG me :DCC SEND f.epub 1 2 3")
+        session._handle_version_request.assert_called_once()
+        session._handle_dcc_offer.assert_called_once()
+
+    def test_is_potential_search_result(self):
+        """Test detection of search result lines by extension."""
+        from app.services.irc import IRCSession
+
+        session = IRCSession()
+
+        assert session._is_potential_search_result(
+            b"!Bot Author - Title.EPUB  ::INFO:: 1.2MB"
+        )
+        assert session._is_potential_search_result(b"!Bot Author - Title.pdf")
+        assert not session._is_potential_search_result(b"!Bot Author - Title 1.2MB")
+        assert not session._is_potential_search_result(b":bot PRIVMSG #c :Title.epub")
+
+    def test_zip_extraction_rejects_unsafe_paths(self):
+        """Test that archive members cannot be written outside the extract dir."""
+        from app.services.irc import IRCSession
+
+        session = IRCSession()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_path = os.path.join(temp_dir, "download.zip")
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                zf.writestr("../escaped.epub", b"outside")
+                zf.writestr("nested/book.epub", b"inside")
+
+            extracted_files = session._extract_zip(zip_path)
+
+            assert extracted_files == [
+                os.path.join(
+                    os.path.realpath(temp_dir),
+                    "download_extracted",
+                    "nested",
+                    "book.epub",
+                )
+            ]
+            assert not os.path.exists(os.path.join(temp_dir, "escaped.epub"))
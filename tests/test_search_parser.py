@@ -41,6 +41,18 @@ class TestSearchParser:
         assert book.size == "1.2MB"
         assert book.full_command == "!test download"
 
+    def test_is_book_line(self):
+        """Test detection of book lines by file extension."""
+        from app.services.search_parser import SearchResultParser
+
+        parser = SearchResultParser()
+
+        assert parser._is_book_line("!Bot Author - Book.EPUB ::INFO:: 1MB")
+        assert parser._is_book_line("!Bot Author - Book.azw3")
+        assert parser._is_book_line("!Bot v1.0 Author - Book.htm")
+        assert not parser._is_book_line("!Bot Author - Book v1.0")
+        assert not parser._is_book_line("Bot Author - Book.epub")
+
     def test_epub_only_filtering(self):
         """Test EPUB-only filtering functionality."""
         from app.services.search_parser import BookDetail, SearchResultParser
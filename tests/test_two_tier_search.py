@@ -40,6 +40,7 @@ class TestTwoTierSearch:
         # Test version removal
         assert self.session._normalize_title("Book Title v5") == "book title"
         assert self.session._normalize_title("Book Title V3") == "book title"
+        assert self.session._normalize_title("Book v1 Title v2 (v3) v4") == "book title"
 
         # Test parentheses and brackets removal
         assert (
@@ -59,6 +60,9 @@ class TestTwoTierSearch:
 
         # Word-based similarity
         assert self.session._is_title_match("great gatsby", "gatsby great") == True
+        assert self.session._is_title_match(
+            "great gatsby", "gatsby great", frozenset({"great", "gatsby"})
+        )
 
         # No match
         assert self.session._is_title_match("different book", "great gatsby") == False
@@ -114,6 +118,31 @@ class TestTwoTierSearch:
         # Should select v5 version
         assert best["title"] == "Book v5"
 
+    def test_rank_candidates(self):
+        """Test that ranking reuses known scores and leaves candidates untouched."""
+        candidates = [
+            {"title": "Book v3", "size": "1.0MB", "format": "pdf", "author": "Author"},
+            {"title": "Book v5", "size": "2.0MB", "format": "epub", "author": "Author"},
+        ]
+        ranked = self.session._rank_candidates(candidates, "title")
+        assert [c["title"] for c in ranked] == ["Book v5", "Book v3"]
+        assert all(set(c) == {"title", "size", "format", "author"} for c in ranked)
+
+        scores = {id(candidates[0]): 2.0, id(candidates[1]): 1.0}
+        with patch.object(
+            self.session, "_calculate_candidate_score", side_effect=AssertionError
+        ):
+            ranked = self.session._rank_candidates(candidates, "title", scores=scores)
+
+        assert [c["title"] for c in ranked] == ["Book v3", "Book v5"]
+
+        candidates += [
+            {"title": f"Book {i}", "size": "1KB", "format": "txt", "author": "Author"}
+            for i in range(6)
+        ]
+        top = self.session._rank_candidates(candidates, "title", top_k=2)
+        assert top == self.session._rank_candidates(candidates, "title")[:2]
+
     def test_parse_size_for_scoring(self):
         """Test size parsing and scoring."""
         # Test different units
@@ -230,6 +259,40 @@ class TestTwoTierSearch:
         assert result["attempt_number"] == 2
         assert result["total_attempts"] == 2
 
+    def test_download_with_timeout_passes_deadline(self):
+        """Test that downloads get a deadline and stuck workers are abandoned."""
+        import threading
+        import time
+
+        deadlines = []
+
+        def download(command, filename, deadline):
+            deadlines.append(deadline)
+            return {"success": False, "error": "Download deadline passed"}
+
+        with patch.object(self.session, "download_file", side_effect=download):
+            before = time.monotonic()
+            result = self.session._download_with_timeout("!server1 book", 60)
+
+        assert result["success"] == False
+        assert before + 60 <= deadlines[0] <= time.monotonic() + 60
+
+        release = threading.Event()
+
+        def stuck_download(command, filename, deadline):
+            release.wait(5)
+            return {"success": True}
+
+        with (
+            patch.object(self.session, "download_file", side_effect=stuck_download),
+            patch("app.services.irc.DOWNLOAD_DEADLINE_GRACE", 0),
+        ):
+            result = self.session._download_with_timeout("!server1 book", 0.1)
+        release.set()
+
+        assert result["success"] == False
+        assert "timeout" in result["error"]
+
     @patch.object(IRCSession, "search_author_level")
     @patch.object(IRCSession, "search_title_level")
     @patch.object(IRCSession, "download_with_fallback")